@@ -0,0 +1,37 @@
+"""Add indexes for trend, match and queue lookups
+
+Revision ID: add_lookup_indexes
+Revises: add_section_confidence_columns
+Create Date: 2026-10-16
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_lookup_indexes'
+down_revision = 'add_section_confidence_columns'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Cache lookups and TTL sweeps on trends
+    op.create_index('ix_trends_expires_at', 'trends', ['expires_at'])
+    op.create_index('ix_trends_keyword_expires', 'trends', ['keyword', 'expires_at'])
+    
+    # Matches per trend ordered by score, and per thread
+    op.create_index('ix_tam_trend_score', 'trend_article_matches', ['trend_id', sa.text('match_score DESC')])
+    op.create_index('ix_tam_thread', 'trend_article_matches', ['thread_id'])
+    
+    # Draining pending queue entries by priority
+    op.create_index('ix_pfq_status_priority', 'proactive_feed_queue', ['status', sa.text('priority_score DESC')])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_pfq_status_priority', table_name='proactive_feed_queue')
+    op.drop_index('ix_tam_thread', table_name='trend_article_matches')
+    op.drop_index('ix_tam_trend_score', table_name='trend_article_matches')
+    op.drop_index('ix_trends_keyword_expires', table_name='trends')
+    op.drop_index('ix_trends_expires_at', table_name='trends')
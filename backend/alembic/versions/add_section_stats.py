@@ -0,0 +1,29 @@
+"""Add section_stats table for materialized 24h match counts
+
+Revision ID: add_section_stats
+Revises: normalize_thread_articles_story_topics
+Create Date: 2026-10-16
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_section_stats'
+down_revision = 'normalize_thread_articles_story_topics'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'section_stats',
+        sa.Column('section_name', sa.String(50), primary_key=True),
+        sa.Column('matches_24h', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('last_updated', sa.DateTime(), nullable=False),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('section_stats')
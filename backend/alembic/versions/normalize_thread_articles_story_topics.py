@@ -0,0 +1,94 @@
+"""Move thread article IDs and story topics into association tables
+
+Revision ID: normalize_thread_articles_story_topics
+Revises: add_lookup_indexes
+Create Date: 2026-10-16
+
+"""
+import json
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'normalize_thread_articles_story_topics'
+down_revision = 'add_lookup_indexes'
+branch_labels = None
+depends_on = None
+
+
+def _load_list(value):
+    """JSON columns come back as str on some drivers and list on others."""
+    if isinstance(value, str):
+        value = json.loads(value)
+    return value or []
+
+
+def upgrade() -> None:
+    thread_articles = op.create_table('thread_articles',
+    sa.Column('thread_id', sa.String(), nullable=False),
+    sa.Column('article_id', sa.String(), nullable=False),
+    sa.ForeignKeyConstraint(['thread_id'], ['threads.thread_id'], ),
+    sa.PrimaryKeyConstraint('thread_id', 'article_id')
+    )
+    op.create_index('ix_thread_articles_article_id', 'thread_articles', ['article_id'])
+    
+    story_topics = op.create_table('story_topics',
+    sa.Column('article_id', sa.String(), nullable=False),
+    sa.Column('topic', sa.String(), nullable=False),
+    sa.ForeignKeyConstraint(['article_id'], ['story_references.article_id'], ),
+    sa.PrimaryKeyConstraint('article_id', 'topic')
+    )
+    op.create_index('ix_story_topics_topic', 'story_topics', ['topic'])
+    
+    # Copy existing JSON lists into the new tables
+    conn = op.get_bind()
+    rows = [
+        {'thread_id': thread_id, 'article_id': str(article_id)}
+        for thread_id, article_ids in conn.execute(sa.text('SELECT thread_id, article_ids FROM threads'))
+        for article_id in dict.fromkeys(_load_list(article_ids))
+    ]
+    if rows:
+        op.bulk_insert(thread_articles, rows)
+    
+    rows = [
+        {'article_id': article_id, 'topic': topic}
+        for article_id, topics in conn.execute(sa.text('SELECT article_id, topics FROM story_references'))
+        for topic in dict.fromkeys(_load_list(topics))
+    ]
+    if rows:
+        op.bulk_insert(story_topics, rows)
+    
+    with op.batch_alter_table('threads') as batch_op:
+        batch_op.drop_column('article_ids')
+    with op.batch_alter_table('story_references') as batch_op:
+        batch_op.drop_column('topics')
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('story_references') as batch_op:
+        batch_op.add_column(sa.Column('topics', sa.JSON(), nullable=True))
+    with op.batch_alter_table('threads') as batch_op:
+        batch_op.add_column(sa.Column('article_ids', sa.JSON(), nullable=True))
+    
+    # Fold the association rows back into JSON lists
+    conn = op.get_bind()
+    threads = sa.table('threads', sa.column('thread_id', sa.String()), sa.column('article_ids', sa.JSON()))
+    grouped = {}
+    for thread_id, article_id in conn.execute(sa.text('SELECT thread_id, article_id FROM thread_articles')):
+        grouped.setdefault(thread_id, []).append(article_id)
+    for thread_id, article_ids in grouped.items():
+        conn.execute(threads.update().where(threads.c.thread_id == thread_id).values(article_ids=article_ids))
+    
+    stories = sa.table('story_references', sa.column('article_id', sa.String()), sa.column('topics', sa.JSON()))
+    grouped = {}
+    for article_id, topic in conn.execute(sa.text('SELECT article_id, topic FROM story_topics')):
+        grouped.setdefault(article_id, []).append(topic)
+    for article_id, topics in grouped.items():
+        conn.execute(stories.update().where(stories.c.article_id == article_id).values(topics=topics))
+    
+    op.drop_index('ix_story_topics_topic', table_name='story_topics')
+    op.drop_table('story_topics')
+    op.drop_index('ix_thread_articles_article_id', table_name='thread_articles')
+    op.drop_table('thread_articles')
@@ -0,0 +1,45 @@
+"""Fill timestamp columns from the database clock
+
+Revision ID: server_default_timestamps
+Revises: add_section_stats
+Create Date: 2026-10-16
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'server_default_timestamps'
+down_revision = 'add_section_stats'
+branch_labels = None
+depends_on = None
+
+
+# (table, column) pairs that now default to the database's current time
+TIMESTAMP_COLUMNS = [
+    ('story_references', 'last_analyzed_at'),
+    ('threads', 'created_at'),
+    ('threads', 'updated_at'),
+    ('topics', 'last_seen_at'),
+    ('trend_data', 'recorded_at'),
+    ('user_feedback', 'created_at'),
+    ('trends', 'recorded_at'),
+    ('trend_article_matches', 'surfaced_at'),
+    ('proactive_feed_queue', 'created_at'),
+    ('section_stats', 'last_updated'),
+]
+
+
+def _set_server_defaults(server_default) -> None:
+    for table, column in TIMESTAMP_COLUMNS:
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.alter_column(column, existing_type=sa.DateTime(), server_default=server_default)
+
+
+def upgrade() -> None:
+    _set_server_defaults(sa.func.now())
+
+
+def downgrade() -> None:
+    _set_server_defaults(None)
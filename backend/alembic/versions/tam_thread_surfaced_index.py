@@ -0,0 +1,27 @@
+"""Index thread matches by surfacing time
+
+Revision ID: tam_thread_surfaced_index
+Revises: server_default_timestamps
+Create Date: 2026-10-16
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'tam_thread_surfaced_index'
+down_revision = 'server_default_timestamps'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Recent matches per thread (resurfacing checks); still serves thread-only lookups
+    op.create_index('ix_tam_thread_surfaced', 'trend_article_matches', ['thread_id', 'surfaced_at'])
+    op.drop_index('ix_tam_thread', table_name='trend_article_matches')
+
+
+def downgrade() -> None:
+    op.create_index('ix_tam_thread', 'trend_article_matches', ['thread_id'])
+    op.drop_index('ix_tam_thread_surfaced', table_name='trend_article_matches')
@@ -1,12 +1,15 @@
-from fastapi import APIRouter, HTTPException
-from pydantic import BaseModel
+from fastapi import APIRouter, HTTPException, Response
+from pydantic import BaseModel, TypeAdapter
 from typing import List, Optional, Dict, Any
 
 from app.services.analyzer import AnalyzerService
-from app.models.schemas import AnalysisOptions as AnalysisOptionsSchema
+from app.models.schemas import AnalysisOptions as AnalysisOptionsSchema, AnalysisResult
 
 router = APIRouter()
 
+# Serializes the response envelope, models included, in one pass through pydantic-core
+_response_adapter = TypeAdapter(Dict[str, Any])
+
 
 class AnalysisOptions(BaseModel):
     max_results: int = 10
@@ -47,6 +50,21 @@ def _convert_options(options: Optional[AnalysisOptions]) -> AnalysisOptionsSchem
     )
 
 
+def _analysis_response(result: AnalysisResult, **extra: Any) -> Response:
+    """Build the JSON response for an analysis result plus any extra data fields."""
+    content = {
+        "success": True,
+        "data": {
+            "query_id": result.query_id,
+            **extra,
+            "threads": result.threads,
+            "extracted_topics": result.extracted_topics,
+            "trend_matches": result.trend_matches,
+        },
+    }
+    return Response(content=_response_adapter.dump_json(content), media_type="application/json")
+
+
 @router.post("/text")
 async def analyze_text(request: TextAnalysisRequest):
     """
@@ -66,15 +84,7 @@ async def analyze_text(request: TextAnalysisRequest):
     
     await analyzer.close()
     
-    return {
-        "success": True,
-        "data": {
-            "query_id": result.query_id,
-            "threads": result.threads,
-            "extracted_topics": result.extracted_topics,
-            "trend_matches": result.trend_matches if hasattr(result, 'trend_matches') else [],
-        },
-    }
+    return _analysis_response(result)
 
 
 @router.post("/article")
@@ -107,16 +117,7 @@ async def analyze_article(request: ArticleAnalysisRequest):
     
     await analyzer.close()
     
-    return {
-        "success": True,
-        "data": {
-            "query_id": result.query_id,
-            "article_id": request.article_id,
-            "threads": result.threads,
-            "extracted_topics": result.extracted_topics,
-            "trend_matches": result.trend_matches if hasattr(result, 'trend_matches') else [],
-        },
-    }
+    return _analysis_response(result, article_id=request.article_id)
 
 
 @router.post("/local-article")
@@ -150,17 +151,7 @@ async def analyze_local_article(request: LocalArticleAnalysisRequest):
         
         await analyzer.close()
         
-        return {
-            "success": True,
-            "data": {
-                "query_id": result.query_id,
-                "article_id": request.article_id,
-                "source": "local",
-                "threads": result.threads,
-                "extracted_topics": result.extracted_topics,
-                "trend_matches": result.trend_matches if hasattr(result, 'trend_matches') else [],
-            },
-        }
+        return _analysis_response(result, article_id=request.article_id, source="local")
     except ValueError as e:
         await analyzer.close()
         raise HTTPException(status_code=404, detail=str(e))
@@ -192,12 +183,4 @@ async def analyze_article_data(request: DirectArticleAnalysisRequest):
     
     await analyzer.close()
     
-    return {
-        "success": True,
-        "data": {
-            "query_id": result.query_id,
-            "threads": result.threads,
-            "extracted_topics": result.extracted_topics,
-            "trend_matches": result.trend_matches if hasattr(result, 'trend_matches') else [],
-        },
-    }
+    return _analysis_response(result)
@@ -13,9 +13,9 @@ from typing import List, Optional, Dict, Any
 from sqlalchemy.orm import Session
 
 from app.models.database import get_db, Trend, ProactiveFeedQueue, TrendArticleMatch
-from app.models.schemas import SectionGroup, ArticleReference
+from app.models.schemas import SectionGroup, ArticleReference, DEFAULT_SECTION_EMOJI, dump_blocks
 from app.services.pitch_generator import PitchGenerator
-from app.services.trends_watch_service import TrendsWatchService
+from app.services.trends_watch_service import TrendsWatchService, get_recent_trend
 from datetime import datetime, timedelta
 import json
 
@@ -151,10 +151,7 @@ async def generate_pitch(
             if not request.section_groups:
                 # If no section groups provided, try to find from database
                 # Get recent matches for this trend
-                trend = db.query(Trend).filter(
-                    Trend.keyword == request.trend_keyword,
-                    Trend.recorded_at > datetime.utcnow() - timedelta(hours=24)
-                ).first()
+                trend = get_recent_trend(db, request.trend_keyword, max_age=timedelta(hours=24))
                 
                 if trend:
                     matches = db.query(TrendArticleMatch).filter(
@@ -174,7 +171,7 @@ async def generate_pitch(
                     for section_name, matches in section_dict.items():
                         request.section_groups.append({
                             "section_name": section_name,
-                            "section_emoji": "📰",
+                            "section_emoji": DEFAULT_SECTION_EMOJI,
                             "articles": [
                                 {
                                     "article_id": m.article_id,
@@ -257,8 +254,8 @@ async def generate_pitch_from_queue(
         if not queue_item:
             raise HTTPException(status_code=404, detail="Queue item not found")
         
-        # Get trend info
-        trend = db.query(Trend).filter(Trend.trend_id == queue_item.trend_id).first()
+        # Get trend info (eager-loaded with the queue item)
+        trend = queue_item.trend
         if not trend:
             raise HTTPException(status_code=404, detail="Trend not found for queue item")
         
@@ -479,7 +476,7 @@ async def generate_pitch_block(
             if not queue_item:
                 raise HTTPException(status_code=404, detail="Queue item not found")
 
-            trend = db.query(Trend).filter(Trend.trend_id == queue_item.trend_id).first()
+            trend = queue_item.trend
             if not trend:
                 raise HTTPException(status_code=404, detail="Trend not found")
 
@@ -512,7 +509,7 @@ async def generate_pitch_block(
 
                 section_groups.append(SectionGroup(
                     section_name=section_name.title(),
-                    section_emoji="📰",
+                    section_emoji=DEFAULT_SECTION_EMOJI,
                     articles=articles,
                     article_count=len(articles),
                     average_score=sum(a.story_score for a in articles) / len(articles) if articles else 0.0,
@@ -558,7 +555,7 @@ async def generate_pitch_block(
             for section_name, section_articles in section_dict.items():
                 section_groups.append(SectionGroup(
                     section_name=section_name.title(),
-                    section_emoji="📰",
+                    section_emoji=DEFAULT_SECTION_EMOJI,
                     articles=section_articles,
                     article_count=len(section_articles),
                     average_score=sum(a.relevance_score for a in section_articles) / len(section_articles) if section_articles else 0.0,
@@ -586,12 +583,7 @@ async def generate_pitch_block(
             raise HTTPException(status_code=500, detail=result.get("error", "Unknown error"))
 
         # Convert blocks to dict for JSON serialization
-        blocks = []
-        for block in result["blocks"]:
-            if hasattr(block, 'model_dump'):
-                blocks.append(block.model_dump())
-            else:
-                blocks.append(block)
+        blocks = dump_blocks(result["blocks"])
 
         return PitchBlockResponse(
             success=True,
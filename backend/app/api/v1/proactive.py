@@ -6,9 +6,9 @@ from datetime import datetime
 
 from app.models.database import get_db
 from app.services.proactive_service import ProactiveService
-from app.services.trends_watch_service import TrendsWatchService
+from app.services.trends_watch_service import TrendsWatchService, purge_expired_trends
 from app.services.block_formatter import BlockFormatter
-from app.models.schemas import Thread
+from app.models.schemas import Thread, dump_blocks
 import json
 
 router = APIRouter()
@@ -61,7 +61,7 @@ async def get_proactive_suggestions(
                 "thread_type": thread.thread_type,
                 "relevance_score": thread.relevance_score,
                 "article_count": len(thread.articles),
-                "blocks": [b.model_dump() for b in thread.blocks]
+                "blocks": dump_blocks(thread.blocks)
             }
             thread_dicts.append(thread_dict)
         
@@ -96,9 +96,7 @@ async def trigger_proactive_scan(
         
         # Clear cache if forcing refresh
         if force_refresh:
-            from app.models.database import Trend
-            db.query(Trend).filter(Trend.expires_at <= datetime.utcnow()).delete()
-            db.commit()
+            purge_expired_trends(db)
         
         # Run the watch cycle
         queue_entries = await trends_service.watch_and_populate()
@@ -10,11 +10,11 @@ Provides:
 from fastapi import APIRouter, Depends, HTTPException, Query
 from pydantic import BaseModel
 from typing import List, Optional
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, raiseload
 
 from app.models.database import get_db, Trend, ProactiveFeedQueue
 from app.integrations.trends import TrendsClient, Trend as TrendSchema
-from app.services.trends_watch_service import TrendsWatchService
+from app.services.trends_watch_service import TrendsWatchService, purge_expired_trends
 from app.config import get_settings
 
 settings = get_settings()
@@ -154,9 +154,7 @@ async def trigger_trends_watch(
         # Clear cache if forcing refresh
         if request.force_refresh:
             # Delete expired trends from cache
-            from datetime import datetime
-            db.query(Trend).filter(Trend.expires_at <= datetime.utcnow()).delete()
-            db.commit()
+            purge_expired_trends(db)
         
         # Run watch cycle (limited to 10 trends to avoid rate limits)
         queue_entries = await service.watch_and_populate(max_trends=10)
@@ -293,7 +291,9 @@ async def get_proactive_queue(
         query = db.query(
             ProactiveFeedQueue,
             Trend.keyword.label("trend_keyword")
-        ).join(Trend, ProactiveFeedQueue.trend_id == Trend.trend_id)
+        ).join(Trend, ProactiveFeedQueue.trend_id == Trend.trend_id).options(
+            raiseload("*")  # Keyword comes from the join, skip eager loads
+        )
         
         if status != "all":
             query = query.filter(ProactiveFeedQueue.status == status)
@@ -364,18 +364,16 @@ async def get_sections(
     try:
         from datetime import datetime, timedelta
         from app.models.schemas import SECTION_EMOJIS
-        from app.models.database import TrendArticleMatch
-        
-        # Get matches from last 24 hours
-        recent_matches = db.query(TrendArticleMatch).filter(
-            TrendArticleMatch.surfaced_at > datetime.utcnow() - timedelta(hours=24)
-        ).all()
+        from app.models.database import SectionStats
+        from app.services.trends_watch_service import refresh_section_stats
         
-        # Count matches per section
-        section_counts = {}
-        for match in recent_matches:
-            section = match.section or 'general'
-            section_counts[section] = section_counts.get(section, 0) + 1
+        # Read materialized counts, recomputing only when they have gone stale
+        stats = db.query(SectionStats).all()
+        stale_before = datetime.utcnow() - timedelta(minutes=settings.section_stats_refresh_minutes)
+        if not stats or min(s.last_updated for s in stats) < stale_before:
+            section_counts = refresh_section_stats(db)
+        else:
+            section_counts = {s.section_name: s.matches_24h for s in stats}
         
         # Build response
         sections = []
@@ -457,9 +455,7 @@ async def demo_trigger_trends_watch(
         
         # Clear cache if forcing refresh
         if force_refresh:
-            from datetime import datetime
-            db.query(Trend).filter(Trend.expires_at <= datetime.utcnow()).delete()
-            db.commit()
+            purge_expired_trends(db)
         
         # Get fresh trends first (for demo display)
         fresh_trends = await trends_client.fetch_daily_trends(geo=settings.trends_geo)
@@ -482,9 +478,8 @@ async def demo_trigger_trends_watch(
         top_matches = []
         
         for item in queue_items:
-            trend = db.query(Trend).filter(Trend.trend_id == item.trend_id).first()
             top_matches.append({
-                "trend_keyword": trend.keyword if trend else "Unknown",
+                "trend_keyword": item.trend.keyword if item.trend else "Unknown",
                 "thread_id": item.thread_id,
                 "priority_score": round(float(item.priority_score), 2) if item.priority_score else 0.0,
                 "status": item.status
@@ -42,12 +42,16 @@ class Settings(BaseSettings):
     
     # Database
     database_url: str = "sqlite:///./data/story_threads.db"
+    db_pool_size: int = 10
+    db_max_overflow: int = 20
+    db_pool_timeout: int = 30  # Seconds to wait for a pooled connection
     
     # Google Trends
     trends_geo: str = "US"
     trends_timeframe: str = "now 7-d"
     trends_cache_ttl_minutes: int = 120
     trends_watch_interval_minutes: int = 60
+    section_stats_refresh_minutes: int = 5  # Max age of section_stats before /sections recomputes
     
     # Trend thresholds
     min_trend_score: int = 50
@@ -73,20 +77,21 @@ class Settings(BaseSettings):
     default_threshold: float = 0.10
     max_results_per_query: int = 10
     rerank_enabled: bool = True
-    cache_ttl_seconds: int = 3600
+    cache_ttl_seconds: int = 3600  # Reuse window for identical archive searches and pitch answers
     
     # Proactive Feed
     proactive_enabled: bool = True
     proactive_scan_interval_hours: int = 24
     proactive_batch_size: int = 5
     min_trend_velocity: int = 50
+    pitch_batch_concurrency: int = 8  # Max concurrent answer calls in generate_pitches_batch
     
     class Config:
         env_file = find_env_file()
         env_file_encoding = "utf-8"
 
 
-@lru_cache()
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
     """Get cached settings instance."""
     return Settings()
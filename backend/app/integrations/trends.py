@@ -7,10 +7,8 @@ import asyncio
 
 from app.config import get_settings
 
-settings = get_settings()
 
-
-@dataclass
+@dataclass(slots=True)
 class Trend:
     """Represents a Google Trend entry."""
     keyword: str
@@ -97,8 +95,10 @@ class TrendsClient:
     """
     
     def __init__(self, geo: str = "US", use_mock: bool = False):
+        settings = get_settings()
         self.geo = geo
         self.timeframe = settings.trends_timeframe
+        self.cache_ttl_minutes = settings.trends_cache_ttl_minutes
         self._client = None
         self._use_mock = use_mock
         self._rate_limiter = RateLimiter(base_delay=5.0, max_delay=60.0)
@@ -132,7 +132,7 @@ class TrendsClient:
         
         trends = []
         now = datetime.utcnow()
-        expires = now + timedelta(minutes=settings.trends_cache_ttl_minutes)
+        expires = now + timedelta(minutes=self.cache_ttl_minutes)
         
         # Try to fetch from API with rate limiting
         api_success = False
@@ -228,7 +228,7 @@ class TrendsClient:
     def _get_demo_trends(self) -> List[Trend]:
         """Generate demo trends when API is unavailable."""
         now = datetime.utcnow()
-        expires = now + timedelta(minutes=settings.trends_cache_ttl_minutes)
+        expires = now + timedelta(minutes=self.cache_ttl_minutes)
         
         # Randomly select and shuffle trends
         selected = random.sample(DEMO_TRENDS, min(len(DEMO_TRENDS), 15))
@@ -1,118 +1,235 @@
-from sqlalchemy import create_engine, Column, String, DateTime, Float, Integer, JSON, ForeignKey, Boolean
-from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker, relationship
 from datetime import datetime
+from itertools import islice
+from typing import Any, Dict, Iterable, List, Optional
+
+from sqlalchemy import create_engine, event, func, insert, make_url, String, DateTime, Float, Integer, ForeignKey, Boolean, Index
+from sqlalchemy.ext.associationproxy import association_proxy
+from sqlalchemy.orm import (
+    DeclarativeBase, Mapped, MappedAsDataclass, Session, mapped_column, relationship, sessionmaker
+)
 
 from app.config import get_settings
 
+__all__ = [
+    "Base", "engine", "SessionLocal", "get_db", "create_tables", "bulk_insert",
+    "StoryReference", "StoryTopic", "Thread", "ThreadArticle", "Topic", "TrendData",
+    "UserFeedback", "Trend", "TrendArticleMatch", "ProactiveFeedQueue", "SectionStats",
+]
+
 settings = get_settings()
 
-engine = create_engine(settings.database_url, connect_args={"check_same_thread": False})
+# Rows per multi-VALUES INSERT when the driver supports it
+INSERT_PAGE_SIZE = 1000
+# SQLite caps bound parameters per statement, keep batches below it
+SQLITE_MAX_BATCH_SIZE = 999
+
+_is_sqlite = make_url(settings.database_url).get_backend_name() == "sqlite"
+
+engine = create_engine(
+    settings.database_url,
+    connect_args={"check_same_thread": False, "timeout": 30} if _is_sqlite else {},
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
+    pool_timeout=settings.db_pool_timeout,
+    pool_pre_ping=True,
+    insertmanyvalues_page_size=INSERT_PAGE_SIZE,
+)
+
+
+if _is_sqlite:
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        """Use WAL so readers don't block while a request is writing."""
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA mmap_size=268435456")
+        cursor.close()
+
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
-Base = declarative_base()
+class Base(MappedAsDataclass, DeclarativeBase, kw_only=True, eq=False):
+    """Declarative base; models are dataclasses with keyword-only constructors."""
 
 
 class StoryReference(Base):
     __tablename__ = "story_references"
     
-    article_id = Column(String, primary_key=True)
-    title = Column(String)
-    author = Column(String)
-    published_date = Column(DateTime)
-    url = Column(String)
-    topics = Column(JSON)
-    last_analyzed_at = Column(DateTime, default=datetime.utcnow)
-    relevance_score = Column(Float)
+    article_id: Mapped[str] = mapped_column(String, primary_key=True)
+    title: Mapped[Optional[str]] = mapped_column(String, default=None)
+    author: Mapped[Optional[str]] = mapped_column(String, default=None)
+    published_date: Mapped[Optional[datetime]] = mapped_column(DateTime, default=None)
+    url: Mapped[Optional[str]] = mapped_column(String, default=None)
+    last_analyzed_at: Mapped[Optional[datetime]] = mapped_column(DateTime, server_default=func.now(), default=None)
+    relevance_score: Mapped[Optional[float]] = mapped_column(Float, default=None)
+    
+    topic_links: Mapped[List["StoryTopic"]] = relationship(
+        back_populates="story", lazy="selectin", cascade="all, delete-orphan", init=False, repr=False
+    )
+    topics = association_proxy("topic_links", "topic", creator=lambda topic: StoryTopic(topic=topic))
+
+
+class StoryTopic(Base):
+    __tablename__ = "story_topics"
+    
+    article_id: Mapped[str] = mapped_column(ForeignKey("story_references.article_id"), primary_key=True, default=None)
+    topic: Mapped[str] = mapped_column(String, primary_key=True, index=True)
+    
+    story: Mapped[Optional[StoryReference]] = relationship(back_populates="topic_links", init=False, repr=False)
 
 
 class Thread(Base):
     __tablename__ = "threads"
     
-    thread_id = Column(String, primary_key=True)
-    thread_type = Column(String)  # evergreen, event_driven, novel_concept
-    central_topic = Column(String)
-    article_ids = Column(JSON)  # List of article IDs
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
-    temporal_span = Column(Integer)  # Days
-    cluster_density = Column(Float)
+    thread_id: Mapped[str] = mapped_column(String, primary_key=True)
+    thread_type: Mapped[Optional[str]] = mapped_column(String, default=None)  # evergreen, event_driven, novel_concept
+    central_topic: Mapped[Optional[str]] = mapped_column(String, default=None)
+    created_at: Mapped[Optional[datetime]] = mapped_column(DateTime, server_default=func.now(), default=None)
+    updated_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime, server_default=func.now(), onupdate=func.now(), default=None
+    )
+    temporal_span: Mapped[Optional[int]] = mapped_column(Integer, default=None)  # Days
+    cluster_density: Mapped[Optional[float]] = mapped_column(Float, default=None)
+    
+    articles: Mapped[List["ThreadArticle"]] = relationship(
+        back_populates="thread", lazy="selectin", cascade="all, delete-orphan", init=False, repr=False
+    )
+    article_ids = association_proxy(
+        "articles", "article_id", creator=lambda article_id: ThreadArticle(article_id=article_id)
+    )
+
+
+class ThreadArticle(Base):
+    __tablename__ = "thread_articles"
+    
+    thread_id: Mapped[str] = mapped_column(ForeignKey("threads.thread_id"), primary_key=True, default=None)
+    article_id: Mapped[str] = mapped_column(String, primary_key=True, index=True)
+    
+    thread: Mapped[Optional[Thread]] = relationship(back_populates="articles", init=False, repr=False)
 
 
 class Topic(Base):
     __tablename__ = "topics"
     
-    topic_id = Column(String, primary_key=True)
-    topic_name = Column(String, unique=True)
-    frequency_count = Column(Integer, default=0)
-    last_seen_at = Column(DateTime, default=datetime.utcnow)
-    trend_velocity = Column(Float)
+    topic_id: Mapped[str] = mapped_column(String, primary_key=True)
+    topic_name: Mapped[Optional[str]] = mapped_column(String, unique=True, default=None)
+    frequency_count: Mapped[Optional[int]] = mapped_column(Integer, default=0)
+    last_seen_at: Mapped[Optional[datetime]] = mapped_column(DateTime, server_default=func.now(), default=None)
+    trend_velocity: Mapped[Optional[float]] = mapped_column(Float, default=None)
 
 
 class TrendData(Base):
     __tablename__ = "trend_data"
     
-    id = Column(Integer, primary_key=True)
-    topic_id = Column(String, ForeignKey("topics.topic_id"))
-    trend_score = Column(Float)
-    recorded_at = Column(DateTime, default=datetime.utcnow)
-    geo_region = Column(String, default="US")
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, init=False)
+    topic_id: Mapped[Optional[str]] = mapped_column(ForeignKey("topics.topic_id"), default=None)
+    trend_score: Mapped[Optional[float]] = mapped_column(Float, default=None)
+    recorded_at: Mapped[Optional[datetime]] = mapped_column(DateTime, server_default=func.now(), default=None)
+    geo_region: Mapped[Optional[str]] = mapped_column(String, default="US")
 
 
 class UserFeedback(Base):
     __tablename__ = "user_feedback"
     
-    feedback_id = Column(String, primary_key=True)
-    thread_id = Column(String, ForeignKey("threads.thread_id"))
-    was_helpful = Column(Boolean)
-    context = Column(String)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    feedback_id: Mapped[str] = mapped_column(String, primary_key=True)
+    thread_id: Mapped[Optional[str]] = mapped_column(ForeignKey("threads.thread_id"), default=None)
+    was_helpful: Mapped[Optional[bool]] = mapped_column(Boolean, default=None)
+    context: Mapped[Optional[str]] = mapped_column(String, default=None)
+    created_at: Mapped[Optional[datetime]] = mapped_column(DateTime, server_default=func.now(), default=None)
 
 
 class Trend(Base):
     __tablename__ = "trends"
     
-    trend_id = Column(Integer, primary_key=True, autoincrement=True)
-    keyword = Column(String, nullable=False)
-    trend_score = Column(Integer, nullable=False)  # 0-100 from Google
-    trend_category = Column(String, nullable=False)  # 'rising', 'top', 'breakout'
-    velocity = Column(Float)  # % change (if available)
-    geo_region = Column(String, default="US")
-    recorded_at = Column(DateTime, default=datetime.utcnow)
-    expires_at = Column(DateTime, nullable=False)  # TTL for cache
+    trend_id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True, init=False)
+    keyword: Mapped[str] = mapped_column(String)
+    trend_score: Mapped[int] = mapped_column(Integer)  # 0-100 from Google
+    trend_category: Mapped[str] = mapped_column(String)  # 'rising', 'top', 'breakout'
+    velocity: Mapped[Optional[float]] = mapped_column(Float, default=None)  # % change (if available)
+    geo_region: Mapped[Optional[str]] = mapped_column(String, default="US")
+    recorded_at: Mapped[Optional[datetime]] = mapped_column(DateTime, server_default=func.now(), default=None)
+    expires_at: Mapped[datetime] = mapped_column(DateTime, index=True)  # TTL for cache
+    
+    # Rarely needed and potentially large, so load explicitly when wanted
+    matches: Mapped[List["TrendArticleMatch"]] = relationship(
+        back_populates="trend", lazy="raise", init=False, repr=False
+    )
+    
+    __table_args__ = (
+        Index("ix_trends_keyword_expires", keyword, expires_at),
+    )
 
 
 class TrendArticleMatch(Base):
     __tablename__ = "trend_article_matches"
 
-    match_id = Column(Integer, primary_key=True, autoincrement=True)
-    trend_id = Column(Integer, ForeignKey("trends.trend_id"))
-    thread_id = Column(String, ForeignKey("threads.thread_id"))
-    article_id = Column(String, nullable=False)
-    infactory_score = Column(Float, nullable=False)  # Relevance score from Infactory
-    match_score = Column(Float, nullable=False)  # Composite: trend_score * infactory_score
-    story_score = Column(Float, nullable=False, default=0.0)  # Per-story score
-    section = Column(String(50))  # Atlantic section (Politics, Culture, etc.)
-    surfaced_at = Column(DateTime, default=datetime.utcnow)
-    times_surfaced = Column(Integer, default=1)
-    last_surfaced_at = Column(DateTime)
+    match_id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True, init=False)
+    trend_id: Mapped[Optional[int]] = mapped_column(ForeignKey("trends.trend_id"), default=None)
+    thread_id: Mapped[Optional[str]] = mapped_column(ForeignKey("threads.thread_id"), default=None)
+    article_id: Mapped[str] = mapped_column(String)
+    infactory_score: Mapped[float] = mapped_column(Float)  # Relevance score from Infactory
+    match_score: Mapped[float] = mapped_column(Float)  # Composite: trend_score * infactory_score
+    story_score: Mapped[float] = mapped_column(Float, default=0.0)  # Per-story score
+    section: Mapped[Optional[str]] = mapped_column(String(50), default=None)  # Atlantic section (Politics, Culture, etc.)
+    surfaced_at: Mapped[Optional[datetime]] = mapped_column(DateTime, server_default=func.now(), default=None)
+    times_surfaced: Mapped[Optional[int]] = mapped_column(Integer, default=1)
+    last_surfaced_at: Mapped[Optional[datetime]] = mapped_column(DateTime, default=None)
+    
+    trend: Mapped[Optional[Trend]] = relationship(back_populates="matches", lazy="joined", init=False, repr=False)
+    thread: Mapped[Optional[Thread]] = relationship(lazy="joined", init=False, repr=False)
+    
+    __table_args__ = (
+        Index("ix_tam_trend_score", trend_id, match_score.desc()),
+        Index("ix_tam_thread_surfaced", thread_id, surfaced_at),
+        Index("idx_matches_section", section),
+    )
 
 
 class ProactiveFeedQueue(Base):
     __tablename__ = "proactive_feed_queue"
 
-    queue_id = Column(Integer, primary_key=True, autoincrement=True)
-    trend_id = Column(Integer, ForeignKey("trends.trend_id"))
-    thread_id = Column(String, ForeignKey("threads.thread_id"))
-    priority_score = Column(Float, nullable=False)  # For ordering queue
-    status = Column(String, default="pending")  # 'pending', 'sent', 'dismissed'
-    created_at = Column(DateTime, default=datetime.utcnow)
-    sent_at = Column(DateTime)
-    blocks_json = Column(String, nullable=False)  # Pre-formatted Block Kit JSON
-    overall_confidence = Column(Float)  # Overall confidence score (0.0-1.0)
-    confidence_level = Column(String(20))  # very_high, high, medium, low, very_low
-    sections_involved = Column(Integer)  # Number of sections with matches
-    total_articles = Column(Integer)  # Total articles across all sections
+    queue_id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True, init=False)
+    trend_id: Mapped[Optional[int]] = mapped_column(ForeignKey("trends.trend_id"), default=None)
+    thread_id: Mapped[Optional[str]] = mapped_column(ForeignKey("threads.thread_id"), default=None)
+    priority_score: Mapped[float] = mapped_column(Float)  # For ordering queue
+    status: Mapped[Optional[str]] = mapped_column(String, default="pending")  # 'pending', 'sent', 'dismissed'
+    created_at: Mapped[Optional[datetime]] = mapped_column(DateTime, server_default=func.now(), default=None)
+    sent_at: Mapped[Optional[datetime]] = mapped_column(DateTime, default=None)
+    blocks_json: Mapped[str] = mapped_column(String)  # Pre-formatted Block Kit JSON
+    overall_confidence: Mapped[Optional[float]] = mapped_column(Float, default=None)  # Overall confidence score (0.0-1.0)
+    confidence_level: Mapped[Optional[str]] = mapped_column(String(20), default=None)  # very_high, high, medium, low, very_low
+    sections_involved: Mapped[Optional[int]] = mapped_column(Integer, default=None)  # Number of sections with matches
+    total_articles: Mapped[Optional[int]] = mapped_column(Integer, default=None)  # Total articles across all sections
+    
+    trend: Mapped[Optional[Trend]] = relationship(lazy="joined", init=False, repr=False)
+    thread: Mapped[Optional[Thread]] = relationship(lazy="selectin", init=False, repr=False)
+    
+    __table_args__ = (
+        Index("ix_pfq_status_priority", status, priority_score.desc()),
+    )
+
+
+class SectionStats(Base):
+    """Per-section match counts for the trailing 24 hours, refreshed periodically."""
+    __tablename__ = "section_stats"
+
+    section_name: Mapped[str] = mapped_column(String(50), primary_key=True)  # As stored on matches; 'general' if unset
+    matches_24h: Mapped[int] = mapped_column(Integer, default=0)
+    last_updated: Mapped[Optional[datetime]] = mapped_column(
+        DateTime, nullable=False, server_default=func.now(), default=None
+    )
+
+
+# Every table the migrations create; fail at import if a model goes missing
+EXPECTED_TABLES = frozenset({
+    "story_references", "story_topics", "threads", "thread_articles", "topics",
+    "trend_data", "user_feedback", "trends", "trend_article_matches",
+    "proactive_feed_queue", "section_stats",
+})
+_missing_tables = EXPECTED_TABLES - Base.metadata.tables.keys()
+if _missing_tables:
+    raise RuntimeError(f"Models missing for tables: {', '.join(sorted(_missing_tables))}")
 
 
 def create_tables():
@@ -120,6 +237,26 @@ def create_tables():
     Base.metadata.create_all(bind=engine)
 
 
+def bulk_insert(
+    db: Session,
+    model,
+    rows: Iterable[Dict[str, Any]],
+    batch_size: int = INSERT_PAGE_SIZE
+) -> None:
+    """
+    Insert many rows for a model in batches.
+
+    Each batch is sent as one executemany instead of one ORM object per row.
+    Every row dict must have the same keys. The caller owns the commit.
+    """
+    if db.get_bind().dialect.name == "sqlite":
+        batch_size = min(batch_size, SQLITE_MAX_BATCH_SIZE)
+    
+    it = iter(rows)
+    while batch := list(islice(it, batch_size)):
+        db.execute(insert(model), batch)
+
+
 def get_db():
     """Get database session."""
     db = SessionLocal()
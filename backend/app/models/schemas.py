@@ -1,10 +1,15 @@
-from typing import List, Optional, Literal
-from pydantic import BaseModel, Field
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Annotated, Any, Dict, List, Optional, Literal, Union
+from pydantic import BaseModel, Field, TypeAdapter
 from datetime import datetime
 
 
 # Block Kit Types
-class TextObject(BaseModel):
+# Slotted dataclasses rather than models: they are built by the thousand while
+# formatting and only validated where they enter an API model.
+@dataclass(slots=True, kw_only=True)
+class TextObject:
     type: Literal["plain_text", "mrkdwn"]
     text: str
     emoji: Optional[bool] = None
@@ -22,14 +27,18 @@ SECTION_EMOJIS = {
     "environment": "🌍",
     "general": "📰",
 }
+DEFAULT_SECTION_EMOJI = SECTION_EMOJIS["general"]
 
 
+@lru_cache(maxsize=128)
 def get_section_emoji(section_name: str) -> str:
     """Get emoji for a section name."""
-    return SECTION_EMOJIS.get(section_name.lower(), "📰")
+    # Section names are usually already lowercase; only fold case on a miss
+    return SECTION_EMOJIS.get(section_name) or SECTION_EMOJIS.get(section_name.lower(), DEFAULT_SECTION_EMOJI)
 
 
-class ButtonElement(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class ButtonElement:
     type: Literal["button"] = "button"
     text: TextObject
     action_id: Optional[str] = None
@@ -37,50 +46,79 @@ class ButtonElement(BaseModel):
     style: Optional[Literal["primary", "danger"]] = None
 
 
-class ImageElement(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class ImageElement:
     type: Literal["image"] = "image"
     image_url: str
     alt_text: str
 
 
-class HeaderBlock(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class HeaderBlock:
     type: Literal["header"] = "header"
     text: TextObject
 
 
-class SectionBlock(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class SectionBlock:
     type: Literal["section"] = "section"
     text: Optional[TextObject] = None
     fields: Optional[List[TextObject]] = None
     accessory: Optional[ButtonElement] = None
 
 
-class ContextBlock(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class ContextBlock:
     type: Literal["context"] = "context"
     elements: List[TextObject]
 
 
-class ActionsBlock(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class ActionsBlock:
     type: Literal["actions"] = "actions"
     elements: List[ButtonElement]
 
 
-class DividerBlock(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class DividerBlock:
     type: Literal["divider"] = "divider"
 
 
-class TimelineEvent(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class TimelineEvent:
     year: int
     title: str
     article_id: str
 
 
-class TimelineBlock(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class TimelineBlock:
     type: Literal["timeline"] = "timeline"
     events: List[TimelineEvent]
 
 
-Block = HeaderBlock | SectionBlock | ContextBlock | ActionsBlock | DividerBlock | TimelineBlock
+# Tagged on ``type`` so validation dispatches straight to the matching block
+Block = Annotated[
+    Union[HeaderBlock, SectionBlock, ContextBlock, ActionsBlock, DividerBlock, TimelineBlock],
+    Field(discriminator="type"),
+]
+
+_block_list_adapter = TypeAdapter(List[Block])
+
+
+def dump_blocks(blocks: List[Block]) -> List[Dict[str, Any]]:
+    """Serialize a list of blocks to plain dicts."""
+    return _block_list_adapter.dump_python(blocks)
+
+
+def encode_blocks(blocks: List[Block]) -> str:
+    """Serialize a list of blocks straight to a JSON string."""
+    return _block_list_adapter.dump_json(blocks).decode()
+
+
+def decode_blocks(raw: str) -> List[Block]:
+    """Parse and validate blocks from a JSON string in one pass."""
+    return _block_list_adapter.validate_json(raw)
 
 
 # API Models
@@ -147,7 +185,7 @@ class ThresholdConfig(BaseModel):
 class SectionGroup(BaseModel):
     """Articles grouped by section."""
     section_name: str
-    section_emoji: str = Field(default="📰", description="Emoji representing the section")
+    section_emoji: str = Field(default=DEFAULT_SECTION_EMOJI, description="Emoji representing the section")
     articles: List[ArticleReference]
     article_count: int = Field(default=0, description="Number of articles in this section")
     average_score: float = Field(default=0.0, description="Average story score in this section")
@@ -11,6 +11,8 @@ Prompts support the following variables:
 - {trend_category}: Type of trend (rising, top, breakout)
 """
 
+import string
+
 # Main pitch generation prompt - used for full pitch generation
 PITCH_GENERATION_PROMPT = """You are a senior Atlantic editor helping a journalist develop a story pitch about "{trend_keyword}".
 
@@ -69,6 +71,27 @@ FOLLOW_UP_PROMPT = """Based on the trend "{trend_keyword}" and Atlantic's previo
 Format as a numbered list with brief context for each question."""
 
 
+# Built-in templates are parsed once at import; custom templates use str.format
+_formatter = string.Formatter()
+_COMPILED_PROMPTS = {
+    template: tuple(_formatter.parse(template))
+    for template in (PITCH_GENERATION_PROMPT, QUICK_PITCH_PROMPT, PITCH_BLOCK_PROMPT, FOLLOW_UP_PROMPT)
+}
+
+
+def _apply_template(parsed: tuple, values: dict) -> str:
+    """Render a pre-parsed template with the given values."""
+    parts = []
+    for literal, field_name, format_spec, conversion in parsed:
+        parts.append(literal)
+        if field_name is not None:
+            value = values[field_name]
+            if conversion:
+                value = _formatter.convert_field(value, conversion)
+            parts.append(format(value, format_spec))
+    return "".join(parts)
+
+
 def format_article_list(articles: list) -> str:
     """Format a list of articles for prompt insertion."""
     if not articles:
@@ -117,12 +140,18 @@ def build_pitch_prompt(
         Formatted prompt string ready for the answers API
     """
     template = prompt_template or PITCH_GENERATION_PROMPT
+    top_articles = articles[:5]
     
-    return template.format(
+    values = dict(
         trend_keyword=trend_keyword,
-        article_list=format_article_list(articles),
-        article_titles=", ".join([a.get('title', 'Untitled') for a in articles[:3]]),
+        article_list=format_article_list(top_articles),
+        article_titles=", ".join(a.get('title', 'Untitled') for a in top_articles[:3]),
         sections=format_sections_list(sections),
         confidence=confidence,
         trend_category=trend_category
     )
+    
+    parsed = _COMPILED_PROMPTS.get(template)
+    if parsed is None:
+        return template.format(**values)
+    return _apply_template(parsed, values)
@@ -1,7 +1,10 @@
 from typing import List, Optional, Dict, Any
+import asyncio
+import logging
 import uuid
 from datetime import datetime
-from collections import defaultdict
+from collections import Counter, defaultdict
+from operator import attrgetter
 
 from app.models.schemas import (
     AnalysisResult, Thread, ArticleReference, AnalysisOptions,
@@ -9,10 +12,42 @@ from app.models.schemas import (
     DividerBlock, TextObject, ButtonElement
 )
 from app.integrations.infactory import InfactoryClient
-from app.integrations.trends import TrendsClient
+from app.integrations.trends import TrendsClient, Trend
 from app.integrations.article_loader import get_article_loader
+from app.integrations.cache import cache_get, cache_set
 from app.services.block_formatter import BlockFormatter
 
+logger = logging.getLogger(__name__)
+
+# Topic extraction: punctuation trimmed from each token, and words never treated as topics
+TOPIC_STRIP_CHARS = '.,!?;:"()[]{}'
+TITLE_STOP_WORDS = frozenset({
+    'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by',
+})
+TOPIC_STOP_WORDS = TITLE_STOP_WORDS | {
+    'is', 'are', 'was', 'were', 'be', 'been', 'have', 'has', 'had', 'do', 'does', 'did',
+    'will', 'would', 'could', 'should',
+}
+
+
+def _year_prefix(value: Any) -> Optional[int]:
+    """Read a leading four-digit year from a date string, or None if there isn't one."""
+    if isinstance(value, str) and value[:4].isdecimal():
+        return int(value[:4])
+    return None
+
+
+def _first_trend_match(topics: List[str], trends: List[Trend]) -> Optional[Trend]:
+    """Return the trend matched by the earliest topic, or None if nothing matches."""
+    trend_lowers = [(trend, trend.keyword.lower()) for trend in trends]
+    for topic in topics:
+        # Simple matching: check if topic is in trend keyword or vice versa
+        topic_lower = topic.lower()
+        for trend, trend_lower in trend_lowers:
+            if topic_lower in trend_lower or trend_lower in topic_lower:
+                return trend
+    return None
+
 
 class AnalyzerService:
     """
@@ -49,13 +84,31 @@ class AnalyzerService:
         Returns Block Kit formatted blocks for display.
         """
         options = options or AnalysisOptions()
-        query_id = f"query_{uuid.uuid4().hex[:8]}"
         
-        # Search archive via Infactory
-        search_results = await self.infactory.search(
-            query=text,
-            limit=options.max_results
-        )
+        # Search archive via Infactory, reusing a recent response for identical queries
+        cache_key = f"analyze_search:{options.max_results}:{text}"
+        search_results = cache_get(cache_key)
+        if search_results is None:
+            search_results = await self.infactory.search(
+                query=text,
+                limit=options.max_results
+            )
+            cache_set(cache_key, search_results)
+        
+        return self.analyze_search_results(text, search_results, options)
+    
+    def analyze_search_results(
+        self,
+        text: str,
+        search_results: Dict[str, Any],
+        options: Optional[AnalysisOptions] = None
+    ) -> AnalysisResult:
+        """
+        Build thread suggestions from search results the caller already has.
+        Lets callers that searched the archive themselves skip a second round-trip.
+        """
+        options = options or AnalysisOptions()
+        query_id = f"query_{uuid.uuid4().hex[:8]}"
         
         # Process search results into threads
         threads = self._create_threads_from_results(
@@ -65,8 +118,7 @@ class AnalyzerService:
         )
         
         # Format each thread with Block Kit blocks
-        for thread in threads:
-            thread.blocks = self.formatter.format_thread_result(thread)
+        self.formatter.format_threads_batch(threads)
         
         # Extract topics (simple keyword extraction for now)
         extracted_topics = self._extract_topics(text, search_results)
@@ -122,26 +174,33 @@ class AnalyzerService:
         clusters = self._cluster_results(filtered_results)
         
         threads = []
+        current_year = datetime.now().year
         for cluster_id, cluster_results in clusters.items():
             if len(cluster_results) < 2:  # Need at least 2 articles for a thread
                 continue
             
+            # Unwrap each result's chunk once for the helpers below
+            chunks = [r.get('chunk') or {} for r in cluster_results]
+            
+            # Publication years feed both the type and the explanation
+            years = self._extract_years(chunks)
+            
             # Determine thread type (simplified for POC)
-            thread_type = self._classify_thread_type(cluster_results)
+            thread_type = self._classify_thread_type(years, current_year)
             if thread_type not in thread_types:
                 continue
             
             # Convert to ArticleReferences
-            articles = self._convert_to_articles(cluster_results)
+            articles = self._convert_to_articles(cluster_results, chunks)
             
             # Calculate relevance as average score
             avg_score = sum(r.get('score', 0) for r in cluster_results) / len(cluster_results)
             
             # Create central topic from top result
-            central_topic = self._extract_central_topic(cluster_results)
+            central_topic = self._extract_central_topic(chunks)
             
             # Create explanation
-            explanation = self._generate_explanation(cluster_results, central_topic)
+            explanation = self._generate_explanation(cluster_results, central_topic, years)
             
             thread = Thread(
                 thread_id=f"thread_{uuid.uuid4().hex[:8]}",
@@ -155,7 +214,7 @@ class AnalyzerService:
             threads.append(thread)
         
         # Sort by relevance score
-        threads.sort(key=lambda x: x.relevance_score, reverse=True)
+        threads.sort(key=attrgetter('relevance_score'), reverse=True)
         
         return threads
     
@@ -180,12 +239,11 @@ class AnalyzerService:
             for field in ['published_date', 'date', 'year']:
                 date_val = metadata.get(field)
                 if date_val:
-                    try:
-                        if isinstance(date_val, str):
-                            year = int(date_val[:4])
+                    if not isinstance(date_val, str):
+                        break
+                    year = _year_prefix(date_val)
+                    if year is not None:
                         break
-                    except (ValueError, TypeError):
-                        continue
             
             # Group by decade if we have a year, otherwise put in general cluster
             if year:
@@ -197,26 +255,31 @@ class AnalyzerService:
             clusters[cluster_key].append(result)
         
         # If we have too many small clusters, merge them
-        final_clusters = {}
-        general_cluster = []
-        
-        for key, cluster_results in clusters.items():
-            if len(cluster_results) >= 2:
-                final_clusters[key] = cluster_results
-            else:
-                general_cluster.extend(cluster_results)
-        
-        if general_cluster:
-            if len(general_cluster) >= 2:
-                final_clusters["mixed"] = general_cluster
-            elif final_clusters:
-                # Add to first cluster if only one item
-                first_key = list(final_clusters.keys())[0]
-                final_clusters[first_key].extend(general_cluster)
+        singletons = []
+        for key in list(clusters):
+            if len(clusters[key]) < 2:
+                singletons.extend(clusters.pop(key))
+        
+        if len(singletons) >= 2:
+            clusters["mixed"] = singletons
+        elif singletons and clusters:
+            # Add to first cluster if only one item
+            clusters[next(iter(clusters))].extend(singletons)
+        
+        return clusters
+    
+    def _extract_years(self, chunks: List[Dict[str, Any]]) -> List[int]:
+        """Parse publication years from the result chunks, skipping undated ones."""
+        years = []
+        for chunk in chunks:
+            date_val = chunk.get('published_at')
+            year = _year_prefix(date_val)
+            if year is not None:
+                years.append(year)
         
-        return final_clusters
+        return years
     
-    def _classify_thread_type(self, results: List[Dict[str, Any]]) -> str:
+    def _classify_thread_type(self, years: List[int], current_year: int) -> str:
         """
         Classify thread type based on article dates and patterns.
         
@@ -224,23 +287,11 @@ class AnalyzerService:
         - event_driven: Articles clustered around specific time periods
         - novel_concept: Recent articles (last 2 years) with few historical precedents
         """
-        years = []
-        for result in results:
-            chunk = result.get('chunk', {})
-            date_val = chunk.get('published_at')
-            if date_val and isinstance(date_val, str):
-                try:
-                    year = int(date_val[:4])
-                    years.append(year)
-                except (ValueError, TypeError):
-                    continue
-        
         if not years:
             return "evergreen"  # Default
         
-        year_range = max(years) - min(years) if len(years) > 1 else 0
         most_recent = max(years)
-        current_year = datetime.now().year
+        year_range = most_recent - min(years)
         
         if year_range >= 5:
             return "evergreen"
@@ -249,59 +300,55 @@ class AnalyzerService:
         else:
             return "event_driven"
     
-    def _convert_to_articles(self, results: List[Dict[str, Any]]) -> List[ArticleReference]:
-        """Convert search results to ArticleReference objects."""
-        articles = []
-        
-        for result in results:
-            chunk = result.get('chunk', {})
-            
-            # Parse date from published_at
-            published_date = None
-            date_val = chunk.get('published_at')
-            if date_val:
-                try:
-                    if isinstance(date_val, str):
-                        # Try different date formats
-                        for fmt in ['%Y-%m-%d', '%Y-%m-%dT%H:%M:%S', '%Y']:
-                            try:
-                                published_date = datetime.strptime(date_val[:10], fmt)
-                                break
-                            except ValueError:
-                                continue
-                except (ValueError, TypeError):
-                    pass
-            
-            article = ArticleReference(
-                article_id=str(chunk.get('article_id', result.get('id', 'unknown'))),
-                title=chunk.get('title', 'Untitled'),
-                author=chunk.get('author'),
-                published_date=published_date,
-                url=None,  # Not provided in chunk
-                excerpt=chunk.get('excerpt'),
-                relevance_score=result.get('score', 0.5)
-            )
-            articles.append(article)
+    def _convert_to_articles(
+        self,
+        results: List[Dict[str, Any]],
+        chunks: List[Dict[str, Any]]
+    ) -> List[ArticleReference]:
+        """Convert search results (and their unwrapped chunks) to ArticleReference objects."""
+        articles = [self._parse_article(result, chunk) for result, chunk in zip(results, chunks)]
         
         # Sort by relevance score
-        articles.sort(key=lambda x: x.relevance_score, reverse=True)
+        articles.sort(key=attrgetter('relevance_score'), reverse=True)
         
         return articles
     
-    def _extract_central_topic(self, results: List[Dict[str, Any]]) -> str:
-        """Extract central topic from top results."""
-        if not results:
+    def _parse_article(self, result: Dict[str, Any], chunk: Dict[str, Any]) -> ArticleReference:
+        """Build an ArticleReference from a single search result and its chunk."""
+        # Parse date from published_at
+        published_date = None
+        date_val = chunk.get('published_at')
+        if date_val and isinstance(date_val, str):
+            # Day precision from ISO dates, falling back to a bare year
+            try:
+                published_date = datetime.fromisoformat(date_val[:10])
+            except ValueError:
+                year = _year_prefix(date_val)
+                if year:
+                    published_date = datetime(year, 1, 1)
+        
+        return ArticleReference(
+            article_id=str(chunk.get('article_id', result.get('id', 'unknown'))),
+            title=chunk.get('title', 'Untitled'),
+            author=chunk.get('author'),
+            published_date=published_date,
+            url=None,  # Not provided in chunk
+            excerpt=chunk.get('excerpt'),
+            relevance_score=result.get('score', 0.5)
+        )
+    
+    def _extract_central_topic(self, chunks: List[Dict[str, Any]]) -> str:
+        """Extract central topic from the top results' chunks."""
+        if not chunks:
             return "Unknown Topic"
         
         # Use top result title as base (from chunk, not metadata)
-        top_chunk = results[0].get('chunk', {})
-        title = top_chunk.get('title', 'Unknown Topic')
+        title = chunks[0].get('title', 'Unknown Topic')
         
         # Try to extract key terms (simplified)
         # Remove common stop words and take first few meaningful words
-        stop_words = {'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by'}
         words = title.lower().split()
-        key_words = [w for w in words if w not in stop_words and len(w) > 2]
+        key_words = [w for w in words if w not in TITLE_STOP_WORDS and len(w) > 2]
         
         if key_words:
             # Return a topic based on key words
@@ -309,19 +356,8 @@ class AnalyzerService:
         
         return title
     
-    def _generate_explanation(self, results: List[Dict[str, Any]], topic: str) -> str:
+    def _generate_explanation(self, results: List[Dict[str, Any]], topic: str, years: List[int]) -> str:
         """Generate an explanation for the thread."""
-        years = []
-        for result in results:
-            chunk = result.get('chunk', {})
-            date_val = chunk.get('published_at')
-            if date_val and isinstance(date_val, str):
-                try:
-                    year = int(date_val[:4])
-                    years.append(year)
-                except (ValueError, TypeError):
-                    continue
-        
         if years:
             year_range = f"{min(years)}-{max(years)}"
             return f"This thread spans {year_range} with {len(results)} related articles on {topic}."
@@ -332,28 +368,23 @@ class AnalyzerService:
         """Extract key topics from text and search results."""
         # Simple keyword extraction from text
         # In a real implementation, we'd use NLP/NER
-        words = text.lower().split()
-        stop_words = {'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by', 'is', 'are', 'was', 'were', 'be', 'been', 'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could', 'should'}
-        
-        # Get word frequencies
-        word_freq = defaultdict(int)
-        for word in words:
-            word = word.strip('.,!?;:"()[]{}').lower()
-            if word not in stop_words and len(word) > 3:
-                word_freq[word] += 1
+        words = (word.strip(TOPIC_STRIP_CHARS) for word in text.lower().split())
+        word_freq = Counter(
+            word for word in words
+            if word not in TOPIC_STOP_WORDS and len(word) > 3
+        )
         
-        # Get top words
-        top_words = sorted(word_freq.items(), key=lambda x: x[1], reverse=True)
-        topics = [word for word, count in top_words[:5]]
+        # Get top words (ties keep first-seen order)
+        topics = [word for word, count in word_freq.most_common(5)]
         
         # Also extract from search result titles
         results = search_results.get('results', [])
         for result in results[:3]:
             metadata = result.get('metadata', {})
             title = metadata.get('title', '')
-            title_words = [w.strip('.,!?;:"()[]{}').lower() for w in title.split() if len(w) > 3]
+            title_words = [w.strip(TOPIC_STRIP_CHARS).lower() for w in title.split() if len(w) > 3]
             for word in title_words:
-                if word not in stop_words and word not in topics:
+                if word not in TOPIC_STOP_WORDS and word not in topics:
                     topics.append(word)
                     if len(topics) >= 5:
                         break
@@ -370,12 +401,17 @@ class AnalyzerService:
         """Analyze specific archive article by ID."""
         options = options or AnalysisOptions()
         
-        # Fetch article content
-        try:
-            article_data = await self.infactory.get_article_content(article_id)
-        except Exception:
-            # If content not available, try metadata
-            article_data = await self.infactory.get_article(article_id)
+        # Fetch content and metadata together so the fallback costs no extra round-trip
+        content_data, metadata = await asyncio.gather(
+            self.infactory.get_article_content(article_id),
+            self.infactory.get_article(article_id),
+            return_exceptions=True
+        )
+        
+        # If content not available, use metadata
+        article_data = metadata if isinstance(content_data, BaseException) else content_data
+        if isinstance(article_data, BaseException):
+            raise article_data
         
         # Extract text for analysis
         content = article_data.get('content', '')
@@ -435,6 +471,15 @@ class AnalyzerService:
         """Close all client connections."""
         await self.infactory.close()
     
+    async def _fetch_current_trends(self) -> Optional[List[Trend]]:
+        """Fetch current trends, or None if the fetch fails."""
+        try:
+            return await self.trends.fetch_daily_trends(geo='US')
+        except Exception as e:
+            # If trends fetch fails, analysis continues without trend context
+            logger.warning(f"Error fetching trends for analysis: {e}", exc_info=True)
+            return None
+    
     async def analyze_text_with_trends(
         self,
         text: str,
@@ -446,46 +491,29 @@ class AnalyzerService:
         This method checks if any extracted topics from the query match
         current Google Trends, and if so, adds trend context to the results.
         """
-        # Do normal analysis first
-        result = await self.analyze_text(text, options)
-        
         # Check if trends should be included
         if not options or not options.include_trends:
-            return result
+            return await self.analyze_text(text, options)
         
-        # Fetch current trends
-        try:
-            current_trends = await self.trends.fetch_daily_trends(geo='US')
-        except Exception as e:
-            # If trends fetch fails, return normal result without trend context
-            print(f"Error fetching trends for analysis: {e}")
-            return result
+        # Archive search and trends fetch are independent, so run them together
+        result, current_trends = await asyncio.gather(
+            self.analyze_text(text, options),
+            self._fetch_current_trends()
+        )
         
         if not current_trends:
             return result
         
         # Check if any extracted topics match current trends
         trend_matches = []
-        matched_trend = None
-        
-        for topic in result.extracted_topics:
-            for trend in current_trends:
-                # Simple matching: check if topic is in trend keyword or vice versa
-                topic_lower = topic.lower()
-                trend_lower = trend.keyword.lower()
-                
-                if topic_lower in trend_lower or trend_lower in topic_lower:
-                    matched_trend = trend
-                    trend_matches.append({
-                        'keyword': trend.keyword,
-                        'score': trend.trend_score,
-                        'category': trend.trend_category,
-                        'velocity': trend.velocity
-                    })
-                    break
-            
-            if matched_trend:
-                break
+        matched_trend = _first_trend_match(result.extracted_topics, current_trends)
+        if matched_trend:
+            trend_matches.append({
+                'keyword': matched_trend.keyword,
+                'score': matched_trend.trend_score,
+                'category': matched_trend.trend_category,
+                'velocity': matched_trend.velocity
+            })
         
         # If we found a matching trend, add context to the first/most relevant thread
         if matched_trend and result.threads:
@@ -1,17 +1,104 @@
-from typing import Any, List, Optional
-from datetime import datetime
+from collections import Counter
+from functools import lru_cache
+from typing import Any, Iterator, List, Optional
 from app.models.schemas import (
     Thread, Block, HeaderBlock, SectionBlock, ContextBlock, ActionsBlock,
     DividerBlock, TimelineBlock, TextObject, ButtonElement, TimelineEvent,
-    ArticleReference, AnalysisResult
+    ArticleReference, AnalysisResult, ConfidenceFactors
 )
 from app.integrations.trends import Trend
+from app.services.confidence_calculator import ConfidenceCalculator
 
 # Configuration constants for block formatting
 MAX_ARTICLES_PER_THREAD = 10  # Max articles to show in a thread
 MAX_ARTICLES_PER_SECTION = 10  # Max articles per section in trend view
 MAX_SECTIONS_TO_SHOW = 5  # Max sections to display
 MAX_BLOCKS_TOTAL = 50  # Slack allows up to 50 blocks per message
+MAX_PITCH_CHARS = 30_000  # Pitch text beyond this is dropped before parsing
+MAX_EXCERPT_LENGTH = 280  # Excerpts longer than this are cut and end with "..."
+
+# Static fragments are shared by every message; blocks are never mutated after formatting
+DIVIDER = DividerBlock()
+ERROR_HEADER = HeaderBlock(text=TextObject(type="plain_text", text="❌ Error"))
+NO_THREADS_HEADER = HeaderBlock(text=TextObject(type="plain_text", text="🔍 No relevant threads found"))
+NO_THREADS_HINT = SectionBlock(
+    text=TextObject(type="mrkdwn", text="Try adjusting your search terms or try a different article.")
+)
+TRENDING_THREADS_HEADER = HeaderBlock(text=TextObject(type="plain_text", text="📰 Trending Story Threads"))
+THRESHOLD_WARNING = SectionBlock(
+    text=TextObject(
+        type="mrkdwn",
+        text="⚠️ *Note:* This trend does not meet all quality thresholds. Results may be less reliable."
+    )
+)
+SECTIONS_WITH_MATCHES_HEADING = SectionBlock(text=TextObject(type="mrkdwn", text="📰 *SECTIONS WITH MATCHES:*"))
+SOURCE_ARTICLES_HEADING = SectionBlock(text=TextObject(type="mrkdwn", text="*📰 Source Articles by Section:*"))
+
+# Button labels
+VIEW_LABEL = TextObject(type="plain_text", text="View")
+HELPFUL_LABEL = TextObject(type="plain_text", text="👍 Helpful")
+NOT_HELPFUL_LABEL = TextObject(type="plain_text", text="👎 Not Helpful")
+SAVE_THREAD_LABEL = TextObject(type="plain_text", text="💾 Save Thread")
+NOT_RELEVANT_LABEL = TextObject(type="plain_text", text="👎 Not Relevant")
+PIN_THREAD_LABEL = TextObject(type="plain_text", text="📌 Save Thread")
+GOOD_PITCH_LABEL = TextObject(type="plain_text", text="👍 Good Pitch")
+NOT_USEFUL_LABEL = TextObject(type="plain_text", text="👎 Not Useful")
+REGENERATE_LABEL = TextObject(type="plain_text", text="🔄 Regenerate")
+
+
+@lru_cache(maxsize=8)
+def _thread_type_label(thread_type: str) -> str:
+    """Display label for a thread type, e.g. "event_driven" -> "Event Driven"."""
+    return thread_type.replace('_', ' ').title()
+
+
+def _feedback_actions(thread_id: str, negative_label: TextObject, save_label: TextObject) -> ActionsBlock:
+    """Helpful / not-helpful / save buttons that close every thread message."""
+    return ActionsBlock(elements=[
+        ButtonElement(
+            text=HELPFUL_LABEL,
+            action_id="feedback_positive",
+            value=thread_id,
+            style="primary"
+        ),
+        ButtonElement(text=negative_label, action_id="feedback_negative", value=thread_id),
+        ButtonElement(text=save_label, action_id="save_thread", value=thread_id)
+    ])
+
+
+@lru_cache(maxsize=4096)
+def _view_article_button(article_id: str) -> ButtonElement:
+    """Shared "View" button for an article; the same article recurs across re-renders."""
+    return ButtonElement(text=VIEW_LABEL, action_id="view_article", value=article_id)
+
+
+def _truncate_excerpt(excerpt: str) -> str:
+    """Cut an excerpt to MAX_EXCERPT_LENGTH characters, marking the cut with "..."."""
+    if len(excerpt) <= MAX_EXCERPT_LENGTH:
+        return excerpt
+    return f"{excerpt[:MAX_EXCERPT_LENGTH]}..."
+
+
+def _plural(count: int) -> str:
+    """Suffix for a counted noun; counts of 0 and 1 both read as singular."""
+    return 's' if count > 1 else ''
+
+
+# Badges and labels only read the configured thresholds, so one calculator serves every call
+_confidence_calculator = ConfidenceCalculator()
+
+
+# Histogram bars are sliced from these rather than built per row
+_BAR_FULL = "█" * 10
+_BAR_EMPTY = "░" * 10
+
+_MONTH_ABBR = ("Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
+
+
+@lru_cache(maxsize=256)
+def _month_year_label(year: int, month: int) -> str:
+    """Format a histogram label, e.g. "Jan 2024"."""
+    return f"{_MONTH_ABBR[month - 1]} {year}"
 
 
 class BlockFormatter:
@@ -25,113 +112,98 @@ class BlockFormatter:
     
     def format_thread_result(self, thread: Thread) -> List[Block]:
         """Format a single thread as Block Kit blocks."""
-        blocks: List[Block] = []
-        
+        return list(self._iter_thread_blocks(thread))
+    
+    def _iter_thread_blocks(self, thread: Thread) -> Iterator[Block]:
+        """Yield the blocks of a single thread without building a per-thread list."""
+        yield from self._thread_prefix_blocks(thread)
+        yield from self._iter_thread_body_blocks(thread)
+    
+    def _thread_prefix_blocks(self, thread: Thread) -> List[Block]:
+        """Header and metadata context that open a thread message."""
         # Header with thread title
-        blocks.append(HeaderBlock(
+        header = HeaderBlock(
             text=TextObject(
                 type="plain_text",
                 text=f"🎯 {thread.central_topic}",
                 emoji=True
             )
-        ))
+        )
         
         # Context with metadata (type, relevance, article count)
         context_elements = [
-            TextObject(type="mrkdwn", text=f"*Type:* {thread.thread_type.replace('_', ' ').title()}"),
+            TextObject(type="mrkdwn", text=f"*Type:* {_thread_type_label(thread.thread_type)}"),
             TextObject(type="mrkdwn", text=f"*Relevance:* {int(thread.relevance_score * 100)}%"),
             TextObject(type="mrkdwn", text=f"*Articles:* {len(thread.articles)}")
         ]
-        blocks.append(ContextBlock(elements=context_elements))
-        
+        return [header, ContextBlock(elements=context_elements)]
+    
+    def _iter_thread_body_blocks(self, thread: Thread) -> Iterator[Block]:
+        """Yield the explanation, coverage histogram, articles and actions of a thread message."""
         # Explanation if available
         if thread.explanation:
-            blocks.append(SectionBlock(
+            yield SectionBlock(
                 text=TextObject(
                     type="mrkdwn",
                     text=f"_{thread.explanation}_"
                 )
-            ))
+            )
         
         # Divider
-        blocks.append(DividerBlock())
+        yield DIVIDER
         
-        # Month+Year distribution if we have articles with dates
-        dated_articles = [a for a in thread.articles if a.published_date]
-        if dated_articles:
-            distribution = self._create_month_year_distribution(dated_articles)
-            if distribution:
-                blocks.append(distribution)
+        # Month+Year distribution if we have articles with dates (undated ones are skipped)
+        distribution = self._create_month_year_distribution(thread.articles)
+        if distribution:
+            yield distribution
 
         # Article sections (show up to 10, or more if we have room)
         max_articles = min(MAX_ARTICLES_PER_THREAD, len(thread.articles))
         for i, article in enumerate(thread.articles[:max_articles], 1):
-            blocks.append(self._format_article_section(article, i))
+            yield self._format_article_section(article, i)
 
         # Show more indicator if there are more articles
         remaining = len(thread.articles) - max_articles
         if remaining > 0:
-            blocks.append(SectionBlock(
+            yield SectionBlock(
                 text=TextObject(
                     type="mrkdwn",
                     text=f"_... and {remaining} more articles_"
                 )
-            ))
-        
-        # Action buttons
-        action_buttons = [
-            ButtonElement(
-                text=TextObject(type="plain_text", text="👍 Helpful"),
-                action_id="feedback_positive",
-                value=f"{thread.thread_id}",
-                style="primary"
-            ),
-            ButtonElement(
-                text=TextObject(type="plain_text", text="👎 Not Helpful"),
-                action_id="feedback_negative",
-                value=f"{thread.thread_id}"
-            ),
-            ButtonElement(
-                text=TextObject(type="plain_text", text="💾 Save Thread"),
-                action_id="save_thread",
-                value=f"{thread.thread_id}"
             )
-        ]
-        blocks.append(ActionsBlock(elements=action_buttons))
         
-        return blocks
+        # Action buttons
+        yield _feedback_actions(thread.thread_id, NOT_HELPFUL_LABEL, SAVE_THREAD_LABEL)
+    
+    def format_threads_batch(self, threads: List[Thread]) -> None:
+        """Format every thread in place, setting each thread's blocks."""
+        for thread in threads:
+            thread.blocks = self.format_thread_result(thread)
     
     def _create_month_year_distribution(self, articles: List[ArticleReference]) -> Optional[SectionBlock]:
         """Create a month+year distribution histogram as a section block."""
-        from collections import Counter
-        
-        # Group articles by month+year
-        month_year_counts = Counter()
-        for article in articles:
-            if article.published_date:
-                key = article.published_date.strftime("%b %Y")  # e.g., "Jan 2024"
-                month_year_counts[key] += 1
+        # Group articles by (year, month); tuples sort chronologically as-is
+        month_year_counts = Counter(
+            (article.published_date.year, article.published_date.month)
+            for article in articles
+            if article.published_date
+        )
         
         if not month_year_counts:
             return None
         
-        # Sort chronologically
-        sorted_items = sorted(
-            month_year_counts.items(),
-            key=lambda x: datetime.strptime(x[0], "%b %Y")
-        )
-        
         # Build distribution text
-        max_count = max(count for _, count in sorted_items)
-        distribution_text = "*Coverage over time:*\n```\n"
+        max_count = max(month_year_counts.values())
+        parts = ["*Coverage over time:*\n```\n"]
         
-        for month_year, count in sorted_items:
+        for (year, month), count in sorted(month_year_counts.items()):
             # Create a simple bar chart using block characters
             bar_length = int((count / max_count) * 10) if max_count > 0 else 0
-            bar = "█" * bar_length + "░" * (10 - bar_length)
-            distribution_text += f"{month_year:>8} │{bar}│ {count}\n"
+            bar = _BAR_FULL[:bar_length] + _BAR_EMPTY[bar_length:]
+            parts.append(f"{_month_year_label(year, month):>8} │{bar}│ {count}\n")
         
-        distribution_text += "```"
+        parts.append("```")
+        distribution_text = "".join(parts)
         
         return SectionBlock(
             text=TextObject(type="mrkdwn", text=distribution_text)
@@ -146,19 +218,17 @@ class BlockFormatter:
         
         author_str = f" | {article.author}" if article.author else ""
         
-        text = f"*{index}. {article.title}*{date_str}\n"
-        text += f"Author: {article.author or 'Unknown'}{author_str} | Relevance: {int(article.relevance_score * 100)}%\n"
+        parts = [
+            f"*{index}. {article.title}*{date_str}\n",
+            f"Author: {article.author or 'Unknown'}{author_str} | Relevance: {int(article.relevance_score * 100)}%\n",
+        ]
         
         if article.excerpt:
-            excerpt = article.excerpt[:280] + "..." if len(article.excerpt) > 280 else article.excerpt
-            text += f"> {excerpt}"
+            parts.append(f"> {_truncate_excerpt(article.excerpt)}")
+        text = "".join(parts)
         
         # Create view button
-        view_button = ButtonElement(
-            text=TextObject(type="plain_text", text="View"),
-            action_id="view_article",
-            value=article.article_id
-        )
+        view_button = _view_article_button(article.article_id)
         
         return SectionBlock(
             text=TextObject(type="mrkdwn", text=text),
@@ -167,65 +237,54 @@ class BlockFormatter:
     
     def format_analysis_result(self, result: AnalysisResult) -> List[Block]:
         """Format a complete analysis result with multiple threads."""
-        blocks: List[Block] = []
+        return list(self.iter_analysis_blocks(result))
+    
+    def iter_analysis_blocks(self, result: AnalysisResult) -> Iterator[Block]:
+        """
+        Yield the blocks of a complete analysis result one at a time.
         
+        Streaming consumers can stop early (e.g. at MAX_BLOCKS_TOTAL)
+        without formatting the remaining threads.
+        """
         if not result.threads:
             # No threads found
-            blocks.append(HeaderBlock(
-                text=TextObject(
-                    type="plain_text",
-                    text="🔍 No relevant threads found"
-                )
-            ))
-            blocks.append(SectionBlock(
-                text=TextObject(
-                    type="mrkdwn",
-                    text="Try adjusting your search terms or try a different article."
-                )
-            ))
-            return blocks
+            yield NO_THREADS_HEADER
+            yield NO_THREADS_HINT
+            return
         
         # Summary header
         thread_count = len(result.threads)
         topic_text = ", ".join(result.extracted_topics[:5]) if result.extracted_topics else "general topics"
         
-        blocks.append(HeaderBlock(
+        yield HeaderBlock(
             text=TextObject(
                 type="plain_text",
-                text=f"📊 Found {thread_count} thread{'s' if thread_count > 1 else ''}"
+                text=f"📊 Found {thread_count} thread{_plural(thread_count)}"
             )
-        ))
+        )
         
         if result.extracted_topics:
-            blocks.append(ContextBlock(
+            yield ContextBlock(
                 elements=[
                     TextObject(type="mrkdwn", text=f"*Topics:* {topic_text}")
                 ]
-            ))
+            )
         
-        blocks.append(DividerBlock())
+        yield DIVIDER
         
         # Format each thread
         for i, thread in enumerate(result.threads):
-            thread_blocks = self.format_thread_result(thread)
-            blocks.extend(thread_blocks)
+            yield from self._iter_thread_blocks(thread)
             
             # Add divider between threads (except after the last one)
-            if i < len(result.threads) - 1:
-                blocks.append(DividerBlock())
-        
-        return blocks
+            if i < thread_count - 1:
+                yield DIVIDER
     
     def format_proactive_suggestions(self, threads: List[Thread]) -> List[Block]:
         """Format proactive thread suggestions."""
         blocks: List[Block] = []
         
-        blocks.append(HeaderBlock(
-            text=TextObject(
-                type="plain_text",
-                text="📰 Trending Story Threads"
-            )
-        ))
+        blocks.append(TRENDING_THREADS_HEADER)
         
         blocks.append(ContextBlock(
             elements=[
@@ -233,7 +292,7 @@ class BlockFormatter:
             ]
         ))
         
-        blocks.append(DividerBlock())
+        blocks.append(DIVIDER)
         
         for thread in threads:
             # Compact format for proactive feed
@@ -241,12 +300,12 @@ class BlockFormatter:
                 text=TextObject(
                     type="mrkdwn",
                     text=f"*🎯 {thread.central_topic}*\n"
-                         f"Type: {thread.thread_type.replace('_', ' ').title()} | "
+                         f"Type: {_thread_type_label(thread.thread_type)} | "
                          f"Relevance: {int(thread.relevance_score * 100)}% | "
                          f"Articles: {len(thread.articles)}"
                 ),
                 accessory=ButtonElement(
-                    text=TextObject(type="plain_text", text="View"),
+                    text=VIEW_LABEL,
                     action_id="view_thread",
                     value=thread.thread_id
                 )
@@ -257,12 +316,7 @@ class BlockFormatter:
     def format_error_message(self, error: str) -> List[Block]:
         """Format an error message as Block Kit blocks."""
         return [
-            HeaderBlock(
-                text=TextObject(
-                    type="plain_text",
-                    text="❌ Error"
-                )
-            ),
+            ERROR_HEADER,
             SectionBlock(
                 text=TextObject(
                     type="mrkdwn",
@@ -282,16 +336,6 @@ class BlockFormatter:
         Adds a trend indicator block at the beginning to show that
         this topic is currently trending.
         """
-        # Get base blocks from normal formatting
-        blocks = self.format_thread_result(thread)
-
-        # Insert trend indicator after header (position 0) and context (position 1)
-        # Find the right position - after header and context blocks
-        insert_position = 0
-        for i, block in enumerate(blocks):
-            if hasattr(block, 'type') and block.type in ['header', 'context']:
-                insert_position = i + 1
-
         # Create trend indicator block
         velocity_str = ""
         if trend.velocity:
@@ -306,10 +350,8 @@ class BlockFormatter:
             ]
         )
 
-        # Insert trend block
-        blocks.insert(insert_position, trend_block)
-
-        return blocks
+        # Trend indicator goes right after the header and context
+        return [*self._thread_prefix_blocks(thread), trend_block, *self._iter_thread_body_blocks(thread)]
     
     def format_trend_thread(
         self,
@@ -353,19 +395,19 @@ class BlockFormatter:
             text=TextObject(
                 type="mrkdwn",
                 text=f"*Thread:* {thread.central_topic}\n"
-                     f"Type: {thread.thread_type.replace('_', ' ').title()} | "
+                     f"Type: {_thread_type_label(thread.thread_type)} | "
                      f"Relevance: {int(thread.relevance_score * 100)}%"
             )
         ))
         
-        blocks.append(DividerBlock())
+        blocks.append(DIVIDER)
         
         # Article sections (top articles)
         if articles:
             blocks.append(SectionBlock(
                 text=TextObject(
                     type="mrkdwn",
-                    text=f"*{len(articles)} relevant Atlantic article{'s' if len(articles) > 1 else ''} found:*"
+                    text=f"*{len(articles)} relevant Atlantic article{_plural(len(articles))} found:*"
                 )
             ))
             
@@ -382,25 +424,7 @@ class BlockFormatter:
                 ))
         
         # Action buttons
-        action_buttons = [
-            ButtonElement(
-                text=TextObject(type="plain_text", text="👍 Helpful"),
-                action_id="feedback_positive",
-                value=f"{thread.thread_id}",
-                style="primary"
-            ),
-            ButtonElement(
-                text=TextObject(type="plain_text", text="👎 Not Relevant"),
-                action_id="feedback_negative",
-                value=f"{thread.thread_id}"
-            ),
-            ButtonElement(
-                text=TextObject(type="plain_text", text="📌 Save Thread"),
-                action_id="save_thread",
-                value=f"{thread.thread_id}"
-            )
-        ]
-        blocks.append(ActionsBlock(elements=action_buttons))
+        blocks.append(_feedback_actions(thread.thread_id, NOT_RELEVANT_LABEL, PIN_THREAD_LABEL))
         
         return blocks
 
@@ -422,22 +446,20 @@ class BlockFormatter:
         - Per-story scores for each article
         - Confidence factors breakdown
         """
-        from app.models.schemas import get_section_emoji, ConfidenceFactors
-        from app.services.confidence_calculator import ConfidenceCalculator
-        
         blocks: List[Block] = []
         
         # Get confidence calculator for badges/labels
-        calc = ConfidenceCalculator()
+        calc = _confidence_calculator
         overall_confidence = confidence_factors.final_confidence
         confidence_badge = calc.get_confidence_badge(overall_confidence)
         confidence_label = calc.get_confidence_label(overall_confidence)
+        confidence_pct = int(overall_confidence * 100)
         
         # Header with confidence badge
         blocks.append(HeaderBlock(
             text=TextObject(
                 type="plain_text",
-                text=f"{confidence_badge} Trending: {trend.keyword} ({int(overall_confidence * 100)}% confidence)",
+                text=f"{confidence_badge} Trending: {trend.keyword} ({confidence_pct}% confidence)",
                 emoji=True
             )
         ))
@@ -451,7 +473,7 @@ class BlockFormatter:
             elements=[
                 TextObject(
                     type="mrkdwn",
-                    text=f"*Confidence:* {confidence_badge} {confidence_label} ({int(overall_confidence * 100)}%) | "
+                    text=f"*Confidence:* {confidence_badge} {confidence_label} ({confidence_pct}%) | "
                          f"*Articles:* {len(articles)} across {len(section_groups)} sections | "
                          f"*Interest:* {trend.trend_score}/100{velocity_str}"
                 )
@@ -460,28 +482,25 @@ class BlockFormatter:
         
         # Threshold warning if not met
         if not threshold_met:
-            blocks.append(SectionBlock(
-                text=TextObject(
-                    type="mrkdwn",
-                    text="⚠️ *Note:* This trend does not meet all quality thresholds. Results may be less reliable."
-                )
-            ))
+            blocks.append(THRESHOLD_WARNING)
         
-        blocks.append(DividerBlock())
+        blocks.append(DIVIDER)
         
         # Section headers and articles
         if section_groups:
-            blocks.append(SectionBlock(
-                text=TextObject(
-                    type="mrkdwn",
-                    text=f"📰 *SECTIONS WITH MATCHES:*"
-                )
-            ))
+            blocks.append(SECTIONS_WITH_MATCHES_HEADING)
+            
+            # Leave room for the breakdown and actions that close the message
+            body_limit = MAX_BLOCKS_TOTAL - 2
             
             for section_group in section_groups[:MAX_SECTIONS_TO_SHOW]:  # Max sections
+                # Stop once a section's header, one article and divider no longer fit
+                if len(blocks) + 3 > body_limit:
+                    break
+                
                 # Section header with emoji
                 section_header = f"{section_group.section_emoji} *{section_group.section_name.upper()}* "
-                section_header += f"({section_group.article_count} article{'s' if section_group.article_count > 1 else ''}, "
+                section_header += f"({section_group.article_count} article{_plural(section_group.article_count)}, "
                 section_header += f"avg: {int(section_group.average_score * 100)}%)"
                 
                 blocks.append(SectionBlock(
@@ -493,10 +512,12 @@ class BlockFormatter:
                 
                 # Articles in this section (top 6 per section)
                 for i, article in enumerate(section_group.articles[:MAX_ARTICLES_PER_SECTION], 1):
+                    if len(blocks) + 1 >= body_limit:  # keep room for the divider
+                        break
                     blocks.append(self._format_section_article(article, i, trend))
                 
                 # "More" indicator if there are additional articles
-                if len(section_group.articles) > MAX_ARTICLES_PER_SECTION:
+                if len(section_group.articles) > MAX_ARTICLES_PER_SECTION and len(blocks) + 1 < body_limit:
                     blocks.append(ContextBlock(
                         elements=[
                             TextObject(
@@ -506,7 +527,7 @@ class BlockFormatter:
                         ]
                     ))
                 
-                blocks.append(DividerBlock())
+                blocks.append(DIVIDER)
         
         # Confidence breakdown (collapsible context)
         if isinstance(confidence_factors, ConfidenceFactors):
@@ -515,7 +536,7 @@ class BlockFormatter:
                 breakdown += f" × Diversity {confidence_factors.diversity_multiplier:.2f}"
             if confidence_factors.velocity_multiplier > 1.0:
                 breakdown += f" × Velocity {confidence_factors.velocity_multiplier:.2f}"
-            breakdown += f" = {int(confidence_factors.final_confidence * 100)}%"
+            breakdown += f" = {confidence_pct}%"
             
             blocks.append(ContextBlock(
                 elements=[
@@ -527,25 +548,7 @@ class BlockFormatter:
             ))
         
         # Action buttons
-        action_buttons = [
-            ButtonElement(
-                text=TextObject(type="plain_text", text="👍 Helpful"),
-                action_id="feedback_positive",
-                value=f"{thread.thread_id}",
-                style="primary"
-            ),
-            ButtonElement(
-                text=TextObject(type="plain_text", text="👎 Not Relevant"),
-                action_id="feedback_negative",
-                value=f"{thread.thread_id}"
-            ),
-            ButtonElement(
-                text=TextObject(type="plain_text", text="📌 Save Thread"),
-                action_id="save_thread",
-                value=f"{thread.thread_id}"
-            )
-        ]
-        blocks.append(ActionsBlock(elements=action_buttons))
+        blocks.append(_feedback_actions(thread.thread_id, NOT_RELEVANT_LABEL, PIN_THREAD_LABEL))
         
         return blocks
 
@@ -556,32 +559,9 @@ class BlockFormatter:
         trend: Trend
     ) -> SectionBlock:
         """Format a single article within a section context."""
-        # Build article text
-        date_str = ""
-        if article.published_date:
-            date_str = f" ({article.published_date.year})"
-        
         # Use story_score if available, otherwise calculate
         story_score = article.story_score if article.story_score else (trend.trend_score / 100) * article.relevance_score
-        
-        text = f"*{index}. {article.title}*{date_str}\n"
-        text += f"Relevance: {int(article.relevance_score * 100)}% | Story Score: {story_score:.2f}\n"
-        
-        if article.excerpt:
-            excerpt = article.excerpt[:280] + "..." if len(article.excerpt) > 280 else article.excerpt
-            text += f"> {excerpt}"
-        
-        # Create view button
-        view_button = ButtonElement(
-            text=TextObject(type="plain_text", text="View"),
-            action_id="view_article",
-            value=article.article_id
-        )
-        
-        return SectionBlock(
-            text=TextObject(type="mrkdwn", text=text),
-            accessory=view_button
-        )
+        return self._format_scored_article(article, index, story_score, "Story Score")
     
     def _format_trend_article_section(
         self,
@@ -590,27 +570,34 @@ class BlockFormatter:
         trend: Trend
     ) -> SectionBlock:
         """Format a single article in a trend context."""
+        # Calculate match score
+        match_score = (trend.trend_score / 100) * article.relevance_score
+        return self._format_scored_article(article, index, match_score, "Match Score")
+    
+    def _format_scored_article(
+        self,
+        article: ArticleReference,
+        index: int,
+        score: float,
+        score_label: str
+    ) -> SectionBlock:
+        """Format an article section showing relevance alongside a trend-derived score."""
         # Build article text
         date_str = ""
         if article.published_date:
             date_str = f" ({article.published_date.year})"
         
-        # Calculate match score
-        match_score = (trend.trend_score / 100) * article.relevance_score
-        
-        text = f"*{index}. {article.title}*{date_str}\n"
-        text += f"Relevance: {int(article.relevance_score * 100)}% | Match Score: {match_score:.2f}\n"
+        parts = [
+            f"*{index}. {article.title}*{date_str}\n",
+            f"Relevance: {int(article.relevance_score * 100)}% | {score_label}: {score:.2f}\n",
+        ]
         
         if article.excerpt:
-            excerpt = article.excerpt[:280] + "..." if len(article.excerpt) > 280 else article.excerpt
-            text += f"> {excerpt}"
+            parts.append(f"> {_truncate_excerpt(article.excerpt)}")
+        text = "".join(parts)
         
         # Create view button
-        view_button = ButtonElement(
-            text=TextObject(type="plain_text", text="View"),
-            action_id="view_article",
-            value=article.article_id
-        )
+        view_button = _view_article_button(article.article_id)
         
         return SectionBlock(
             text=TextObject(type="mrkdwn", text=text),
@@ -653,14 +640,18 @@ class BlockFormatter:
             elements=[
                 TextObject(
                     type="mrkdwn",
-                    text=f"*Confidence:* {confidence_pct}% | Based on {len(section_groups)} section{'s' if len(section_groups) > 1 else ''} of coverage"
+                    text=f"*Confidence:* {confidence_pct}% | Based on {len(section_groups)} section{_plural(len(section_groups))} of coverage"
                 )
             ]
         ))
         
-        blocks.append(DividerBlock())
+        blocks.append(DIVIDER)
         
         # Main pitch content
+        # Bound the input before parsing; Slack only ever shows a small slice of it
+        if len(pitch_text) > MAX_PITCH_CHARS:
+            pitch_text = pitch_text[:MAX_PITCH_CHARS]
+        
         # Split pitch text into sections if it contains headers
         if "**" in pitch_text:
             # Parse markdown-style headers
@@ -703,21 +694,16 @@ class BlockFormatter:
                 )
             ))
         
-        blocks.append(DividerBlock())
+        blocks.append(DIVIDER)
         
         # Source articles section
         if section_groups:
-            blocks.append(SectionBlock(
-                text=TextObject(
-                    type="mrkdwn",
-                    text="*📰 Source Articles by Section:*"
-                )
-            ))
+            blocks.append(SOURCE_ARTICLES_HEADING)
 
             article_count = 0
             for sg in section_groups:
                 # Add section header with emoji
-                section_header = f"{sg.section_emoji} *{sg.section_name}* ({sg.article_count} article{'s' if sg.article_count > 1 else ''})"
+                section_header = f"{sg.section_emoji} *{sg.section_name}* ({sg.article_count} article{_plural(sg.article_count)})"
                 blocks.append(SectionBlock(
                     text=TextObject(type="mrkdwn", text=section_header)
                 ))
@@ -742,18 +728,18 @@ class BlockFormatter:
         # Action buttons
         action_buttons = [
             ButtonElement(
-                text=TextObject(type="plain_text", text="👍 Good Pitch"),
+                text=GOOD_PITCH_LABEL,
                 action_id="pitch_helpful",
                 value=f"pitch_{trend_keyword}",
                 style="primary"
             ),
             ButtonElement(
-                text=TextObject(type="plain_text", text="👎 Not Useful"),
+                text=NOT_USEFUL_LABEL,
                 action_id="pitch_not_helpful",
                 value=f"pitch_{trend_keyword}"
             ),
             ButtonElement(
-                text=TextObject(type="plain_text", text="🔄 Regenerate"),
+                text=REGENERATE_LABEL,
                 action_id="regenerate_pitch",
                 value=f"regenerate_{trend_keyword}"
             )
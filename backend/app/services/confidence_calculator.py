@@ -1,16 +1,38 @@
 """Confidence calculation service for trend-surfaced stories."""
 
+from collections import Counter, defaultdict
+from operator import attrgetter
 from typing import List, Dict, Any
 import math
 
 from app.models.schemas import (
-    ArticleReference, SectionGroup, ConfidenceFactors, ThresholdConfig
+    ArticleReference, SectionGroup, ConfidenceFactors, ThresholdConfig, get_section_emoji
 )
 from app.integrations.trends import Trend
 from app.config import get_settings
 
 settings = get_settings()
 
+# Display badge and label for each confidence level
+CONFIDENCE_BADGES = {
+    'very_high': '🔥',
+    'high': '✅',
+    'medium': '⚠️',
+    'low': '❓',
+    'very_low': '❌'
+}
+CONFIDENCE_LABELS = {
+    'very_high': 'Very High',
+    'high': 'High',
+    'medium': 'Medium',
+    'low': 'Low',
+    'very_low': 'Very Low'
+}
+
+# Article count bonus sqrt(count / 10), tabulated; it caps at 1.0 from 10 articles on
+COUNT_BONUS_CAP = 10
+_COUNT_BONUS = tuple(math.sqrt(n / 10.0) for n in range(COUNT_BONUS_CAP + 1))
+
 
 class ConfidenceCalculator:
     """
@@ -68,7 +90,7 @@ class ConfidenceCalculator:
         Returns a ConfidenceFactors object with all calculation components.
         """
         if not articles:
-            return ConfidenceFactors(
+            return ConfidenceFactors.model_construct(
                 base_confidence=0.0,
                 article_count_bonus=0.0,
                 diversity_multiplier=1.0,
@@ -83,14 +105,12 @@ class ConfidenceCalculator:
         
         # Article count bonus: sqrt(article_count / 10) with diminishing returns
         # More articles increase confidence, but with diminishing returns
-        article_count_normalized = len(articles) / 10.0
-        count_bonus = math.sqrt(min(article_count_normalized, 1.0))  # Cap at 1.0
+        count_bonus = _COUNT_BONUS[min(len(articles), COUNT_BONUS_CAP)]  # Cap at 1.0
         
         base_confidence = avg_score * (0.8 + 0.2 * count_bonus)
         
         # Diversity multiplier: bonus for articles across multiple sections
-        sections = set(art.section for art in articles if art.section)
-        unique_sections = len(sections)
+        unique_sections = len({art.section for art in articles if art.section})
         diversity_multiplier = 1.0 + (unique_sections / 10.0)
         diversity_multiplier = min(diversity_multiplier, 1.5)  # Cap at 1.5
         
@@ -101,7 +121,7 @@ class ConfidenceCalculator:
             velocity_multiplier = 1.0 + min(trend.velocity / 200.0, 0.05)
         
         # Check thresholds
-        threshold_met = self._check_thresholds(articles, unique_sections)
+        threshold_met = self._check_thresholds(articles, unique_sections, story_scores)
         threshold_penalty = 0.0 if threshold_met else 1.0  # 1.0 = 100% penalty
         
         # Calculate final confidence
@@ -111,7 +131,8 @@ class ConfidenceCalculator:
             final_confidence = base_confidence * diversity_multiplier * velocity_multiplier
             final_confidence = min(final_confidence, 1.0)  # Cap at 1.0
         
-        return ConfidenceFactors(
+        # Every field is a float computed above, so skip re-validation
+        return ConfidenceFactors.model_construct(
             base_confidence=round(base_confidence, 3),
             article_count_bonus=round(count_bonus * 0.2 * avg_score, 3),
             diversity_multiplier=round(diversity_multiplier, 3),
@@ -123,7 +144,8 @@ class ConfidenceCalculator:
     def _check_thresholds(
         self,
         articles: List[ArticleReference],
-        unique_sections: int
+        unique_sections: int,
+        story_scores: List[float]
     ) -> bool:
         """
         Check if results meet minimum thresholds.
@@ -139,17 +161,13 @@ class ConfidenceCalculator:
             return False
         
         # Check min articles per section
-        section_counts: Dict[str, int] = {}
-        for art in articles:
-            section = art.section or 'general'
-            section_counts[section] = section_counts.get(section, 0) + 1
+        section_counts = Counter(art.section or 'general' for art in articles)
         
         min_count = min(section_counts.values()) if section_counts else 0
         if min_count < self.config.min_articles_per_section:
             return False
         
-        # Check min story scores
-        story_scores = [art.story_score for art in articles if art.story_score]
+        # Check min story scores (the non-zero scores already gathered by the caller)
         if story_scores and min(story_scores) < self.config.min_story_score:
             return False
         
@@ -174,27 +192,11 @@ class ConfidenceCalculator:
     
     def get_confidence_badge(self, confidence: float) -> str:
         """Get emoji badge for confidence level."""
-        level = self.get_confidence_level(confidence)
-        badges = {
-            'very_high': '🔥',
-            'high': '✅',
-            'medium': '⚠️',
-            'low': '❓',
-            'very_low': '❌'
-        }
-        return badges.get(level, '❓')
+        return CONFIDENCE_BADGES.get(self.get_confidence_level(confidence), '❓')
     
     def get_confidence_label(self, confidence: float) -> str:
         """Get human-readable label for confidence level."""
-        level = self.get_confidence_level(confidence)
-        labels = {
-            'very_high': 'Very High',
-            'high': 'High',
-            'medium': 'Medium',
-            'low': 'Low',
-            'very_low': 'Very Low'
-        }
-        return labels.get(level, 'Unknown')
+        return CONFIDENCE_LABELS.get(self.get_confidence_level(confidence), 'Unknown')
 
 
 def create_section_groups(
@@ -205,21 +207,22 @@ def create_section_groups(
     
     Returns a list of SectionGroup objects sorted by average score descending.
     """
-    from app.models.schemas import get_section_emoji
-    
-    # Group articles by section
-    section_dict: Dict[str, List[ArticleReference]] = {}
+    # Group articles by section, tallying non-zero story scores as we go
+    section_dict: Dict[str, List[ArticleReference]] = defaultdict(list)
+    score_sums: Dict[str, float] = defaultdict(float)
+    score_counts: Dict[str, int] = defaultdict(int)
     for article in articles:
         section = article.section or 'general'
-        if section not in section_dict:
-            section_dict[section] = []
         section_dict[section].append(article)
+        if article.story_score:
+            score_sums[section] += article.story_score
+            score_counts[section] += 1
     
     # Create SectionGroup objects
     groups = []
     for section_name, section_articles in section_dict.items():
-        scores = [art.story_score for art in section_articles if art.story_score]
-        avg_score = sum(scores) / len(scores) if scores else 0.0
+        score_count = score_counts[section_name]
+        avg_score = score_sums[section_name] / score_count if score_count else 0.0
         
         # Sort articles by story score descending
         sorted_articles = sorted(
@@ -228,7 +231,8 @@ def create_section_groups(
             reverse=True
         )
         
-        groups.append(SectionGroup(
+        # Built from already-validated articles and computed floats; skip re-validation
+        groups.append(SectionGroup.model_construct(
             section_name=section_name.title(),
             section_emoji=get_section_emoji(section_name),
             articles=sorted_articles,
@@ -238,6 +242,6 @@ def create_section_groups(
         ))
     
     # Sort by average score descending
-    groups.sort(key=lambda g: g.average_score, reverse=True)
+    groups.sort(key=attrgetter('average_score'), reverse=True)
     
     return groups
@@ -1,11 +1,14 @@
 """Pitch Generator service for creating story pitches from trend-surfaced articles."""
 
-from typing import List, Optional, Dict, Any
+import asyncio
+from itertools import islice
+from typing import Iterator, List, Optional, Dict, Any
 from datetime import datetime
 
 from app.models.schemas import (
     ArticleReference, SectionGroup, TrendMessageResult, ArticleReference
 )
+from app.integrations.cache import cache_get, cache_set
 from app.integrations.infactory import InfactoryClient
 from app.config import get_settings
 from app.prompts import build_pitch_prompt, PITCH_BLOCK_PROMPT
@@ -13,6 +16,18 @@ from app.prompts import build_pitch_prompt, PITCH_BLOCK_PROMPT
 settings = get_settings()
 
 
+def _iter_sentences(text: str) -> Iterator[str]:
+    """Yield the '.'-separated pieces of text lazily, as str.split('.') would list them."""
+    start = 0
+    while True:
+        end = text.find('.', start)
+        if end < 0:
+            yield text[start:]
+            return
+        yield text[start:end]
+        start = end + 1
+
+
 class PitchGenerator:
     """
     Generates story pitches using the Infactory answer API.
@@ -27,12 +42,37 @@ class PitchGenerator:
         """Initialize with optional Infactory client."""
         self.infactory = infactory_client or InfactoryClient()
     
+    async def _cached_answer(
+        self,
+        query: str,
+        top_k: int,
+        filters: Optional[Dict[str, Any]] = None,
+        no_cache: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Call the answer API, reusing a recent response for an identical request.
+        
+        Resurfacing scans re-pitch the same trend and articles, so identical
+        queries recur within the cache TTL. Pass no_cache to always hit the API.
+        """
+        if no_cache:
+            return await self.infactory.answer(query=query, top_k=top_k, filters=filters)
+        
+        filters_key = repr(sorted(filters.items())) if filters else ""
+        cache_key = f"pitch_answer:{top_k}:{filters_key}:{query}"
+        answer_result = cache_get(cache_key)
+        if answer_result is None:
+            answer_result = await self.infactory.answer(query=query, top_k=top_k, filters=filters)
+            cache_set(cache_key, answer_result)
+        return answer_result
+    
     async def generate_pitch_from_trend(
         self,
         trend_keyword: str,
         section_groups: List[SectionGroup],
         overall_confidence: float,
-        trend_category: str = "rising"
+        trend_category: str = "rising",
+        generated_at: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         Generate a story pitch based on trend-surfaced articles.
@@ -42,6 +82,7 @@ class PitchGenerator:
             section_groups: Articles grouped by section
             overall_confidence: Confidence score for this trend match
             trend_category: Type of trend (rising, top, etc.)
+            generated_at: Optional ISO timestamp to stamp on the pitch (defaults to now)
         
         Returns:
             Dict with pitch text, historical context, and suggested angles
@@ -59,7 +100,7 @@ class PitchGenerator:
         
         # Call answer API
         try:
-            answer_result = await self.infactory.answer(
+            answer_result = await self._cached_answer(
                 query=query,
                 top_k=15,
                 filters=filters if filters else None
@@ -77,7 +118,8 @@ class PitchGenerator:
             section_groups=section_groups,
             answer_result=answer_result,
             overall_confidence=overall_confidence,
-            trend_category=trend_category
+            trend_category=trend_category,
+            generated_at=generated_at
         )
         
         return {
@@ -85,6 +127,27 @@ class PitchGenerator:
             "pitch": pitch_data
         }
     
+    async def generate_pitches_batch(
+        self,
+        items: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Generate pitches for several trends concurrently.
+        
+        Each item holds the keyword arguments of generate_pitch_from_trend.
+        At most settings.pitch_batch_concurrency answer calls are in flight at
+        once; results come back in item order, failures as unsuccessful results.
+        Pitches share one generated_at stamp unless an item sets its own.
+        """
+        semaphore = asyncio.Semaphore(settings.pitch_batch_concurrency)
+        generated_at = datetime.utcnow().isoformat()
+        
+        async def generate(item: Dict[str, Any]) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.generate_pitch_from_trend(**{"generated_at": generated_at, **item})
+        
+        return await asyncio.gather(*(generate(item) for item in items))
+    
     def _build_pitch_query(
         self,
         trend_keyword: str,
@@ -126,7 +189,8 @@ class PitchGenerator:
         section_groups: List[SectionGroup],
         answer_result: Dict[str, Any],
         overall_confidence: float,
-        trend_category: str
+        trend_category: str,
+        generated_at: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         Structure the answer API response into a pitch format.
@@ -136,16 +200,22 @@ class PitchGenerator:
         citations = answer_result.get("citations", [])
         follow_up_questions = answer_result.get("follow_up_questions", [])
         
-        # Get article metadata from our results
+        # Get article metadata and covered sections from our results in one pass
         article_summaries = []
+        sections_covered = []
         for sg in section_groups:
+            section_name = sg.section_name
+            sections_covered.append(section_name)
+            if len(article_summaries) >= 6:  # Top 6 sources already collected
+                continue
             for article in sg.articles[:2]:  # Top 2 per section
+                published_date = article.published_date
                 article_summaries.append({
                     "id": article.article_id,
                     "title": article.title,
                     "author": article.author,
-                    "year": article.published_date.year if article.published_date else None,
-                    "section": sg.section_name,
+                    "year": published_date.year if published_date else None,
+                    "section": section_name,
                     "relevance_score": article.relevance_score,
                     "story_score": article.story_score
                 })
@@ -167,8 +237,8 @@ class PitchGenerator:
             "source_articles": article_summaries[:6],  # Top 6 sources
             "citations": citations[:5],  # Top 5 citations
             "follow_up_questions": follow_up_questions[:3],  # Top 3 follow-ups
-            "sections_covered": [sg.section_name for sg in section_groups],
-            "generated_at": datetime.utcnow().isoformat()
+            "sections_covered": sections_covered,
+            "generated_at": generated_at or datetime.utcnow().isoformat()
         }
         
         return pitch
@@ -185,14 +255,15 @@ class PitchGenerator:
         headlines = []
         
         # Look for sentences that might be headline-worthy
-        sentences = answer_text.split('.')
-        for sentence in sentences[:5]:  # Check first 5 sentences
+        for sentence in islice(_iter_sentences(answer_text), 5):  # Check first 5 sentences
             sentence = sentence.strip()
             # If sentence is reasonable headline length (30-100 chars)
             if 30 <= len(sentence) <= 100:
                 headlines.append(sentence)
+                if len(headlines) == 3:  # Return top 3
+                    break
         
-        return headlines[:3]  # Return top 3
+        return headlines
     
     def _extract_lead_angle(self, answer_text: str) -> str:
         """
@@ -200,14 +271,13 @@ class PitchGenerator:
         
         Returns the first substantial sentence as the lead.
         """
-        sentences = answer_text.split('.')
-        for sentence in sentences:
+        for sentence in _iter_sentences(answer_text):
             sentence = sentence.strip()
             if len(sentence) > 50:  # Substantial sentence
                 return sentence + "."
         
         # Fallback to first sentence
-        return sentences[0].strip() + "." if sentences else ""
+        return answer_text.partition('.')[0].strip() + "."
     
     async def generate_quick_pitch(
         self,
@@ -235,7 +305,7 @@ class PitchGenerator:
             query += "; ".join([f"\"{art.title}\"" for art in articles[:3]])
         
         try:
-            answer_result = await self.infactory.answer(
+            answer_result = await self._cached_answer(
                 query=query,
                 top_k=10
             )
@@ -316,9 +386,11 @@ class PitchGenerator:
         
         # Call answer API
         try:
-            answer_result = await self.infactory.answer(
+            # Custom prompts are one-off experiments; always ask for a fresh answer
+            answer_result = await self._cached_answer(
                 query=query,
-                top_k=10
+                top_k=10,
+                no_cache=custom_prompt is not None
             )
         except Exception as e:
             return {
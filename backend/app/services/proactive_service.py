@@ -1,8 +1,8 @@
-from typing import List, Optional
+import time
+from typing import Dict, List, Optional
 from sqlalchemy.orm import Session
-import json
 
-from app.models.schemas import Thread, ArticleReference
+from app.models.schemas import Thread, ArticleReference, decode_blocks
 from app.services.trends_watch_service import TrendsWatchService
 from app.models.database import ProactiveFeedQueue
 
@@ -57,7 +57,7 @@ class ProactiveService:
             for item in queue_items:
                 try:
                     # Parse blocks JSON
-                    blocks_data = json.loads(item.blocks_json)
+                    blocks_data = decode_blocks(item.blocks_json)
                     
                     # Reconstruct thread from queue item
                     # Note: In production, you might want to fetch the full thread
@@ -89,8 +89,7 @@ class ProactiveService:
         if self.db is None:
             raise ValueError("Database session required")
         
-        from datetime import datetime
-        scan_id = f"scan_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}"
+        scan_id = f"scan_{time.strftime('%Y%m%d_%H%M%S', time.gmtime())}"
         
         try:
             service = self._get_trends_service()
@@ -118,7 +117,10 @@ class ProactiveService:
             from app.models.database import TrendArticleMatch, Trend
             from datetime import datetime, timedelta
             
-            recent_match = self.db.query(TrendArticleMatch).join(Trend).filter(
+            # Best recent match and its trend's velocity in one round-trip
+            recent_match = self.db.query(
+                TrendArticleMatch.match_score, Trend.velocity
+            ).join(Trend).filter(
                 TrendArticleMatch.thread_id == thread.thread_id,
                 TrendArticleMatch.surfaced_at > datetime.utcnow() - timedelta(hours=24)
             ).order_by(
@@ -127,11 +129,8 @@ class ProactiveService:
             
             if recent_match and recent_match.match_score >= 0.3:
                 # Check trend velocity
-                trend = self.db.query(Trend).filter(
-                    Trend.trend_id == recent_match.trend_id
-                ).first()
-                
-                if trend and trend.velocity and trend.velocity >= min_trend_velocity:
+                velocity = recent_match.velocity
+                if velocity and velocity >= min_trend_velocity:
                     return True
             
             return False
@@ -139,3 +138,46 @@ class ProactiveService:
         except Exception as e:
             print(f"Error checking resurfacing eligibility: {e}")
             return False
+    
+    async def should_resurface_many(
+        self,
+        threads: List[Thread],
+        min_trend_velocity: float = 50.0
+    ) -> Dict[str, bool]:
+        """
+        Batch form of should_resurface for a resurfacing scan.
+        
+        Fetches the recent matches of every thread in one query and applies
+        the same rule to each thread's best match. Returns a flag per thread_id.
+        """
+        eligible = {thread.thread_id: False for thread in threads}
+        if not self.db or not eligible:
+            return eligible
+        
+        try:
+            from app.models.database import TrendArticleMatch, Trend
+            from datetime import datetime, timedelta
+            
+            rows = self.db.query(
+                TrendArticleMatch.thread_id, TrendArticleMatch.match_score, Trend.velocity
+            ).join(Trend).filter(
+                TrendArticleMatch.thread_id.in_(list(eligible)),
+                TrendArticleMatch.surfaced_at > datetime.utcnow() - timedelta(hours=24)
+            ).order_by(
+                TrendArticleMatch.match_score.desc()
+            ).all()
+            
+            # Rows arrive best match first; only each thread's first row counts
+            seen = set()
+            for thread_id, match_score, velocity in rows:
+                if thread_id in seen:
+                    continue
+                seen.add(thread_id)
+                if match_score >= 0.3 and velocity and velocity >= min_trend_velocity:
+                    eligible[thread_id] = True
+            
+            return eligible
+            
+        except Exception as e:
+            print(f"Error checking resurfacing eligibility: {e}")
+            return {thread_id: False for thread_id in eligible}
@@ -1,5 +1,7 @@
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from datetime import datetime, timedelta
+from cachetools import TTLCache
+from sqlalchemy import delete, func, insert, select
 from sqlalchemy.orm import Session
 
 from app.config import get_settings
@@ -7,14 +9,19 @@ from app.integrations.trends import TrendsClient, Trend
 from app.integrations.infactory import InfactoryClient
 from app.services.analyzer import AnalyzerService
 from app.services.confidence_calculator import ConfidenceCalculator, create_section_groups
-from app.models.database import Trend as TrendModel, TrendArticleMatch, ProactiveFeedQueue
+from app.models.database import (
+    Trend as TrendModel, TrendArticleMatch, ProactiveFeedQueue, SectionStats, bulk_insert
+)
 from app.models.schemas import (
-    AnalysisOptions, ArticleReference, TrendMessageResult, ThresholdConfig
+    AnalysisOptions, ArticleReference, TrendMessageResult, ThresholdConfig, encode_blocks
 )
 from app.services.block_formatter import BlockFormatter
 
 settings = get_settings()
 
+# Hot (keyword, geo_region) -> newest Trend lookups, busted whenever trends are written
+_trend_cache: TTLCache = TTLCache(maxsize=1024, ttl=60)
+
 
 class TrendsWatchService:
     """
@@ -90,6 +97,8 @@ class TrendsWatchService:
                 continue
         
         print(f"Added {new_entries} new entries to proactive queue")
+        if new_entries:
+            refresh_section_stats(self.db)
         return new_entries
     
     async def _get_cached_or_fetch_trends(self) -> List[Trend]:
@@ -121,35 +130,28 @@ class TrendsWatchService:
             TrendModel.expires_at > now
         ).order_by(TrendModel.trend_score.desc()).all()
         
-        return [
-            Trend(
-                trend_id=t.trend_id,
-                keyword=t.keyword,
-                trend_score=t.trend_score,
-                trend_category=t.trend_category,
-                velocity=t.velocity,
-                geo_region=t.geo_region,
-                recorded_at=t.recorded_at,
-                expires_at=t.expires_at
-            )
-            for t in db_trends
-        ]
+        return [_trend_from_row(t) for t in db_trends]
     
     def _cache_trends(self, trends: List[Trend]):
         """Cache trends in database."""
-        for trend in trends:
-            db_trend = TrendModel(
-                keyword=trend.keyword,
-                trend_score=trend.trend_score,
-                trend_category=trend.trend_category,
-                velocity=trend.velocity,
-                geo_region=trend.geo_region,
-                recorded_at=trend.recorded_at or datetime.utcnow(),
-                expires_at=trend.expires_at or (datetime.utcnow() + timedelta(minutes=settings.trends_cache_ttl_minutes))
-            )
-            self.db.add(db_trend)
+        now = datetime.utcnow()
+        expires = now + timedelta(minutes=settings.trends_cache_ttl_minutes)
+        
+        bulk_insert(self.db, TrendModel, [
+            {
+                "keyword": trend.keyword,
+                "trend_score": trend.trend_score,
+                "trend_category": trend.trend_category,
+                "velocity": trend.velocity,
+                "geo_region": trend.geo_region,
+                "recorded_at": trend.recorded_at or now,
+                "expires_at": trend.expires_at or expires,
+            }
+            for trend in trends
+        ])
         
         self.db.commit()
+        bust_trend_cache()
     
     async def _find_articles_for_trend(self, trend: Trend) -> Optional[TrendMessageResult]:
         """
@@ -180,10 +182,11 @@ class TrendsWatchService:
             print(f"No Infactory results for trend: {trend.keyword}")
             return None
         
-        # Create thread from results using analyzer
+        # Create thread from the results we already have (no second search)
         try:
-            analysis = await self.analyzer.analyze_text(
+            analysis = self.analyzer.analyze_search_results(
                 text=trend.keyword,
+                search_results=results,
                 options=AnalysisOptions(
                     max_results=settings.trends_max_results,
                     threshold=settings.trends_threshold
@@ -197,18 +200,16 @@ class TrendsWatchService:
             print(f"No threads created for trend: {trend.keyword}")
             return None
         
+        # Section per article ID, from metadata when group_by=section is used
+        sections = self._extract_sections_from_results(results)
+        
         # Collect all articles and calculate story scores
         all_articles: List[ArticleReference] = []
         for thread in analysis.threads:
             for article in thread.articles:
                 # Calculate per-story score
                 article.story_score = self.confidence.calculate_story_score(article, trend)
-                
-                # Try to extract section from metadata if available
-                # This would come from Infactory results when group_by=section is used
-                article.section = self._extract_section_from_result(
-                    results, article.article_id
-                )
+                article.section = sections.get(article.article_id, 'general')
                 
                 all_articles.append(article)
         
@@ -264,29 +265,31 @@ class TrendsWatchService:
             threshold_met=threshold_met
         )
     
-    def _extract_section_from_result(
+    def _extract_sections_from_results(
         self, 
-        search_results: Dict[str, Any], 
-        article_id: str
-    ) -> Optional[str]:
+        search_results: Dict[str, Any]
+    ) -> Dict[str, str]:
         """
-        Extract section from search results for a given article ID.
+        Map article IDs to sections in one pass over the search results.
         
         When Infactory returns grouped results, we can extract section info.
+        Articles without section metadata are left out; callers default them to 'general'.
         """
-        # Try to find section in results metadata
-        results = search_results.get('results', [])
-        for result in results:
+        sections: Dict[str, str] = {}
+        for result in search_results.get('results', []):
             metadata = result.get('metadata', {})
-            if metadata.get('id') == article_id or result.get('id') == article_id:
-                # Check for section in various possible fields
-                for field in ['section', 'category', 'department', 'desk']:
-                    section = metadata.get(field)
-                    if section:
-                        return section.lower()
-        
-        # Default to 'general' if not found
-        return 'general'
+            # Check for section in various possible fields
+            section = next(
+                (metadata.get(field) for field in ('section', 'category', 'department', 'desk') if metadata.get(field)),
+                None
+            )
+            if not section:
+                continue
+            for article_id in (metadata.get('id'), result.get('id')):
+                if article_id is not None:
+                    sections.setdefault(article_id, section.lower())
+        
+        return sections
     
     async def _queue_proactive_suggestions(
         self, 
@@ -303,23 +306,25 @@ class TrendsWatchService:
             return 0
         
         # Get or create trend in DB
-        db_trend = self.db.query(TrendModel).filter(
-            TrendModel.keyword == trend.keyword,
-            TrendModel.recorded_at > datetime.utcnow() - timedelta(hours=1)
-        ).first()
+        db_trend = get_recent_trend(self.db, trend.keyword, trend.geo_region, max_age=timedelta(hours=1))
         
-        if not db_trend:
-            db_trend = TrendModel(
-                keyword=trend.keyword,
-                trend_score=trend.trend_score,
-                trend_category=trend.trend_category,
-                velocity=trend.velocity,
-                geo_region=trend.geo_region,
-                recorded_at=datetime.utcnow(),
-                expires_at=datetime.utcnow() + timedelta(minutes=settings.trends_cache_ttl_minutes)
-            )
-            self.db.add(db_trend)
-            self.db.flush()  # Get trend_id
+        if db_trend:
+            trend_id = db_trend.trend_id
+        else:
+            # Single INSERT ... RETURNING instead of add + flush to get the ID back
+            now = datetime.utcnow()
+            trend_id = self.db.execute(
+                insert(TrendModel).values(
+                    keyword=trend.keyword,
+                    trend_score=trend.trend_score,
+                    trend_category=trend.trend_category,
+                    velocity=trend.velocity,
+                    geo_region=trend.geo_region,
+                    recorded_at=now,
+                    expires_at=now + timedelta(minutes=settings.trends_cache_ttl_minutes)
+                ).returning(TrendModel.trend_id)
+            ).scalar_one()
+            bust_trend_cache()
         
         # Use primary thread_id from section groups
         thread_id = f"thread_{trend.keyword.replace(' ', '_').lower()}"
@@ -345,36 +350,36 @@ class TrendsWatchService:
             return 0
         
         # Create trend article matches with section info
-        for section_group in trend_result.section_groups:
-            for article in section_group.articles:
-                db_match = TrendArticleMatch(
-                    trend_id=db_trend.trend_id,
-                    thread_id=thread_id,
-                    article_id=article.article_id,
-                    infactory_score=article.relevance_score,
-                    match_score=article.story_score,
-                    story_score=article.story_score,
-                    section=section_group.section_name.lower(),
-                    surfaced_at=datetime.utcnow(),
-                    times_surfaced=1,
-                    last_surfaced_at=datetime.utcnow()
-                )
-                self.db.add(db_match)
+        now = datetime.utcnow()
+        bulk_insert(self.db, TrendArticleMatch, [
+            {
+                "trend_id": trend_id,
+                "thread_id": thread_id,
+                "article_id": article.article_id,
+                "infactory_score": article.relevance_score,
+                "match_score": article.story_score,
+                "story_score": article.story_score,
+                "section": section_group.section_name.lower(),
+                "surfaced_at": now,
+                "times_surfaced": 1,
+                "last_surfaced_at": now,
+            }
+            for section_group in trend_result.section_groups
+            for article in section_group.articles
+        ])
         
         # Calculate priority score
         velocity_multiplier = 1.5 if trend.trend_category == 'rising' else 1.2
         priority_score = trend_result.overall_confidence * velocity_multiplier
         
-        import json
-        
         # Add to proactive queue with confidence and section data
         queue_entry = ProactiveFeedQueue(
-            trend_id=db_trend.trend_id,
+            trend_id=trend_id,
             thread_id=thread_id,
             priority_score=priority_score,
             status='pending',
             created_at=datetime.utcnow(),
-            blocks_json=json.dumps([b.model_dump() if hasattr(b, 'model_dump') else b for b in trend_result.blocks]),
+            blocks_json=encode_blocks(trend_result.blocks),
             overall_confidence=trend_result.overall_confidence,
             confidence_level=trend_result.confidence_level,
             sections_involved=trend_result.sections_with_matches,
@@ -410,3 +415,104 @@ class TrendsWatchService:
     def get_current_trends(self, limit: int = 20) -> List[Trend]:
         """Get current cached trends."""
         return self._get_cached_trends()[:limit]
+
+
+def _trend_from_row(row: TrendModel) -> Trend:
+    """Detach a Trend row into the session-independent Trend dataclass."""
+    return Trend(
+        trend_id=row.trend_id,
+        keyword=row.keyword,
+        trend_score=row.trend_score,
+        trend_category=row.trend_category,
+        velocity=row.velocity,
+        geo_region=row.geo_region,
+        recorded_at=row.recorded_at,
+        expires_at=row.expires_at
+    )
+
+
+def get_recent_trend(
+    db: Session,
+    keyword: str,
+    geo_region: Optional[str] = None,
+    max_age: timedelta = timedelta(hours=24)
+) -> Optional[Trend]:
+    """
+    Get the newest trend recorded for a keyword within max_age.
+    
+    Hits are served from an in-process cache for up to a minute; misses are not cached.
+    """
+    key: Tuple[str, str] = (keyword, geo_region or settings.trends_geo)
+    cutoff = datetime.utcnow() - max_age
+    
+    cached = _trend_cache.get(key)
+    if cached and cached.recorded_at > cutoff:
+        return cached
+    
+    row = db.query(TrendModel).filter(
+        TrendModel.keyword == key[0],
+        TrendModel.geo_region == key[1],
+        TrendModel.recorded_at > cutoff
+    ).order_by(TrendModel.recorded_at.desc()).first()
+    if not row:
+        return None
+    
+    trend = _trend_from_row(row)
+    _trend_cache[key] = trend
+    return trend
+
+
+def bust_trend_cache() -> None:
+    """Drop cached trend lookups after trends are inserted or deleted."""
+    _trend_cache.clear()
+
+
+def purge_expired_trends(db: Session, batch_size: int = 5000) -> int:
+    """
+    Delete expired cached trends in bounded batches, committing after each.
+    
+    Returns the number of trends deleted. Matches and queue entries are kept as history.
+    """
+    expired_ids = select(TrendModel.trend_id).where(
+        TrendModel.expires_at <= datetime.utcnow()
+    ).limit(batch_size)
+    
+    deleted = 0
+    while True:
+        ids = db.execute(
+            delete(TrendModel)
+            .where(TrendModel.trend_id.in_(expired_ids))
+            .returning(TrendModel.trend_id)
+            .execution_options(synchronize_session=False)
+        ).scalars().all()
+        db.commit()
+        deleted += len(ids)
+        if len(ids) < batch_size:
+            break
+    
+    bust_trend_cache()
+    return deleted
+
+
+def refresh_section_stats(db: Session) -> Dict[str, int]:
+    """
+    Recompute per-section match counts for the last 24 hours into section_stats.
+    
+    Returns the fresh counts keyed by section name.
+    """
+    now = datetime.utcnow()
+    section = func.coalesce(TrendArticleMatch.section, 'general')
+    counts = dict(
+        db.query(section, func.count(TrendArticleMatch.match_id))
+        .filter(TrendArticleMatch.surfaced_at > now - timedelta(hours=24))
+        .group_by(section)
+        .all()
+    )
+    
+    db.query(SectionStats).delete()
+    bulk_insert(db, SectionStats, [
+        {"section_name": name, "matches_24h": count, "last_updated": now}
+        for name, count in counts.items()
+    ])
+    db.commit()
+    return counts